@@ -1,23 +1,81 @@
 import os
+import mmap
 import hashlib
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
 import struct
-from typing import Optional
+import platform
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import Optional, Union
 from .plugin_system.plugin_base import HookPoint
+from .utils import drop_page_cache
 
 # Constants
-CHUNK_SIZE = 64 * 1024  # 64 KB chunks
+# Read size when decrypting; 1 MB keeps OpenSSL busy per update() call
+# while bounding memory
+CHUNK_SIZE = 1024 * 1024  # 1 MB chunks
+# Window fed to OpenSSL per update() call when encrypting a memory-mapped
+# file; large windows keep the Python-level loop to a handful of calls
+MMAP_WINDOW = 16 * 1024 * 1024
 SALT = b'stegecrypt_salt'
-MAGIC_BYTES = b'STEGECRYPT'  # File format identifier
+MAGIC_BYTES = b'STEGECRYPT'  # Legacy AES-CFB format identifier
+MAGIC_BYTES_GCM = b'STEGECRYP2'  # AES-GCM format identifier, same length
+NONCE_SIZE = 12
+TAG_SIZE = 16
+# GCM's 32-bit block counter limits one message to 2**32 - 2 blocks (~64 GiB)
+GCM_MAX_PLAINTEXT = (2**32 - 2) * 16
+# Derived keys kept per session by CryptoManager.make_cipher_factory
+KEY_CACHE_SIZE = 16
+
+@lru_cache(maxsize=None)
+def has_aes_ni() -> Optional[bool]:
+    """Report whether the CPU has hardware AES instructions.
+    
+    OpenSSL picks AES-NI (or the ARMv8 crypto extensions) automatically
+    when present, so this only tells the user why encryption might be
+    slow. Returns None when the platform gives no cheap way to tell.
+    """
+    if platform.system() != 'Linux':
+        return None
+    try:
+        with open('/proc/cpuinfo', 'r') as cpuinfo:
+            for line in cpuinfo:
+                # x86 lists "flags", ARM lists "Features"
+                if line.startswith(('flags', 'Features')):
+                    return 'aes' in line.split(':', 1)[1].split()
+    except OSError:
+        pass
+    return None
+
+class CipherFactory:
+    """Builds AES ciphers for a key that has already been derived.
+    
+    Deriving a key runs 100k PBKDF2 iterations, so batches derive it once
+    and reuse the factory for every file, supplying only a fresh nonce.
+    """
+    
+    def __init__(self, key: bytes):
+        self.key = key
+        self._algorithm = algorithms.AES(key)
+    
+    def gcm(self, nonce: bytes, tag: Optional[bytes] = None) -> Cipher:
+        """Return an AES-GCM cipher; pass the tag when decrypting."""
+        return Cipher(self._algorithm, modes.GCM(nonce, tag), backend=default_backend())
+    
+    def cfb(self, iv: bytes) -> Cipher:
+        """Return an AES-CFB cipher for files in the legacy format."""
+        return Cipher(self._algorithm, modes.CFB(iv), backend=default_backend())
 
 class CryptoManager:
     """Manages cryptographic operations with plugin support."""
     
     def __init__(self, plugin_manager=None):
         self.plugin_manager = plugin_manager
+        # (path, mtime, size) -> CipherFactory, see make_cipher_factory()
+        self._key_cache = {}
         if self.plugin_manager:
             self.plugin_manager.execute_hook(HookPoint.CRYPTO_INIT.value, manager=self)
     
@@ -30,6 +88,12 @@ class CryptoManager:
                 print(f"Plugin error during {hook_point}: {str(e)}")
         return []
 
+    def has_listeners(self, *hook_points: str) -> bool:
+        """Check whether any plugin handles one of the given hook points."""
+        return bool(self.plugin_manager) and any(
+            self.plugin_manager.has_listeners(hook_point) for hook_point in hook_points
+        )
+
     def derive_key(self, key_file_path: str) -> bytes:
         """Derive an encryption key from a key file."""
         # Execute pre-key-generation hook
@@ -68,10 +132,105 @@ class CryptoManager:
         except Exception as e:
             raise ValueError(f"Failed to derive key: {str(e)}")
 
-    def encrypt_file(self, input_file: str, key_file: str, output_file: str) -> None:
-        """Encrypt a file using AES-256."""
-        key = self.derive_key(key_file)
-        iv = os.urandom(16)
+    def make_cipher_factory(self, key_file: str) -> CipherFactory:
+        """Derive the key for a key file once and return a reusable cipher factory.
+        
+        Factories are cached for the session, keyed on the key file's path,
+        modification time and size, so running several batches with the
+        same key file pays for the KDF only once. Editing or replacing the
+        key file changes the cache key and forces a fresh derivation.
+        
+        A cache hit skips derive_key() and its key generation hooks, so the
+        cache is bypassed while any plugin handles those hooks.
+        """
+        if self.has_listeners(HookPoint.PRE_KEY_GENERATION.value, HookPoint.POST_KEY_GENERATION.value):
+            return CipherFactory(self.derive_key(key_file))
+        
+        try:
+            stat = os.stat(key_file)
+            cache_key = (os.path.abspath(key_file), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            # Let derive_key() report the problem
+            return CipherFactory(self.derive_key(key_file))
+        
+        factory = self._key_cache.get(cache_key)
+        if factory is None:
+            factory = CipherFactory(self.derive_key(key_file))
+            if len(self._key_cache) >= KEY_CACHE_SIZE:
+                # Drop the oldest entry
+                self._key_cache.pop(next(iter(self._key_cache)))
+            self._key_cache[cache_key] = factory
+        return factory
+
+    def _get_factory(self, key: Union[str, CipherFactory]) -> CipherFactory:
+        """Return the given cipher factory, or build one from a key file path."""
+        if isinstance(key, CipherFactory):
+            return key
+        return self.make_cipher_factory(key)
+
+    def encrypt_file(self, input_file: str, key_file: Union[str, CipherFactory], output_file: str) -> None:
+        """Encrypt a file using AES-256.
+        
+        key_file may be a key file path or a CipherFactory from
+        make_cipher_factory(), which skips key derivation.
+        """
+        self._encrypt(input_file, key_file, output_file)
+
+    def encrypt_bytes(self, data: bytes, input_file: str, key_file: Union[str, CipherFactory], output_file: str) -> None:
+        """Encrypt plaintext that has already been read into memory.
+        
+        input_file is only used for the stored extension and for hooks; it
+        is not read. This lets callers prefetch the next file while the
+        current one is being encrypted.
+        """
+        self._encrypt(input_file, key_file, output_file, data=data)
+
+    def encrypt_and_hash(self, input_file: str, key_file: Union[str, CipherFactory], output_file: str,
+                         data: Optional[bytes] = None) -> str:
+        """Encrypt a file and return the SHA-256 digest of its plaintext.
+
+        The hash and the cipher are fed from the same pass over the input,
+        so the file is only read once. If data is given it is used as the
+        plaintext, as in encrypt_bytes(). The file hash hooks run around
+        the digest just as they do for compute_file_hash(), so plugins can
+        see or replace it.
+        """
+        self.execute_hook(
+            HookPoint.PRE_FILE_HASH.value,
+            file_path=input_file,
+            hash_type='sha256'
+        )
+        
+        hasher = hashlib.sha256()
+        self._encrypt(input_file, key_file, output_file, hasher, data=data)
+        hash_value = hasher.hexdigest()
+        
+        results = self.execute_hook(
+            HookPoint.POST_FILE_HASH.value,
+            file_path=input_file,
+            hash_type='sha256',
+            hash_value=hash_value
+        )
+        
+        # Allow plugins to modify the hash value
+        if results and isinstance(results[0], str):
+            hash_value = results[0]
+        
+        return hash_value
+
+    def _encrypt(self, input_file: str, key_file: Union[str, CipherFactory], output_file: str, hasher=None, data=None) -> None:
+        """Encrypt a file, optionally updating a hash object with the plaintext.
+        
+        Output layout: magic | extension length | extension | nonce | tag |
+        ciphertext. The GCM tag authenticates the header and ciphertext, so
+        a separate decrypt-and-compare pass is not needed to verify it.
+        
+        If data is given it is used as the plaintext instead of reading
+        input_file.
+        """
+        factory = self._get_factory(key_file)
+        key = factory.key
+        iv = os.urandom(NONCE_SIZE)
         
         # Execute pre-encryption hook
         self.execute_hook(
@@ -83,30 +242,56 @@ class CryptoManager:
         )
         
         try:
-            cipher = Cipher(algorithms.AES(key), modes.CFB(iv), backend=default_backend())
-            encryptor = cipher.encryptor()
+            encryptor = factory.gcm(iv).encryptor()
 
             # Get original file extension
             _, ext = os.path.splitext(input_file)
             ext_bytes = ext.encode('utf-8')
             ext_length = len(ext_bytes)
+            
+            # Format identifier, extension length and extension
+            header = MAGIC_BYTES_GCM + struct.pack('<I', ext_length) + ext_bytes
+            encryptor.authenticate_additional_data(header)
 
-            with open(input_file, 'rb') as infile, open(output_file, 'wb') as outfile:
-                # Write format identifier
-                outfile.write(MAGIC_BYTES)
-                
-                # Write extension length and extension
-                outfile.write(struct.pack('<I', ext_length))
-                outfile.write(ext_bytes)
+            with ExitStack() as stack:
+                if data is None:
+                    infile = stack.enter_context(open(input_file, 'rb'))
+                    # Runs once the map below is closed
+                    stack.callback(drop_page_cache, infile.fileno())
+                    # Empty files cannot be memory-mapped
+                    data = b''
+                    if os.fstat(infile.fileno()).st_size:
+                        data = stack.enter_context(
+                            mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+                        )
+                # Checked before the output is opened, so an oversized
+                # input never truncates an existing file
+                if len(data) > GCM_MAX_PLAINTEXT:
+                    raise ValueError(
+                        "File is too large to encrypt: AES-GCM is limited to "
+                        "about 64 GiB per file"
+                    )
+                outfile = stack.enter_context(open(output_file, 'wb'))
+                outfile.write(header)
                 
-                # Write IV
+                # Write nonce, and reserve room for the tag which is only
+                # known once all data has been encrypted
                 outfile.write(iv)
+                tag_offset = outfile.tell()
+                outfile.write(bytes(TAG_SIZE))
                 
                 # Write encrypted data
-                while chunk := infile.read(CHUNK_SIZE):
-                    encrypted_chunk = encryptor.update(chunk)
-                    outfile.write(encrypted_chunk)
+                with memoryview(data) as view:
+                    for offset in range(0, len(view), MMAP_WINDOW):
+                        with view[offset:offset + MMAP_WINDOW] as chunk:
+                            if hasher is not None:
+                                hasher.update(chunk)
+                            outfile.write(encryptor.update(chunk))
                 outfile.write(encryptor.finalize())
+                outfile.seek(tag_offset)
+                outfile.write(encryptor.tag)
+                outfile.flush()
+                drop_page_cache(outfile.fileno())
             
             # Execute post-encryption hook
             self.execute_hook(
@@ -127,9 +312,17 @@ class CryptoManager:
             )
             raise ValueError(f"Encryption failed: {str(e)}")
 
-    def decrypt_file(self, input_file: str, key_file: str, output_file: str) -> str:
-        """Decrypt a file using AES-256."""
-        key = self.derive_key(key_file)
+    def decrypt_file(self, input_file: str, key_file: Union[str, CipherFactory], output_file: str,
+                     require_integrity: bool = False) -> str:
+        """Decrypt a file using AES-256.
+        
+        key_file may be a key file path or a CipherFactory from
+        make_cipher_factory(), which skips key derivation. With
+        require_integrity, legacy files that carry no authentication tag
+        are refused instead of decrypted unchecked.
+        """
+        factory = self._get_factory(key_file)
+        key = factory.key
         
         # Execute pre-decryption hook
         self.execute_hook(
@@ -141,19 +334,7 @@ class CryptoManager:
         
         try:
             with open(input_file, 'rb') as infile:
-                # Verify file format
-                magic = infile.read(len(MAGIC_BYTES))
-                if magic != MAGIC_BYTES:
-                    raise ValueError("Invalid file format or not a StegeCrypt file")
-                
-                # Read original extension
-                ext_length = struct.unpack('<I', infile.read(4))[0]
-                ext = infile.read(ext_length).decode('utf-8')
-                
-                # Read IV
-                iv = infile.read(16)
-                cipher = Cipher(algorithms.AES(key), modes.CFB(iv), backend=default_backend())
-                decryptor = cipher.decryptor()
+                ext, decryptor = self._open_decryptor(infile, factory, require_integrity)
                 
                 # Create output path with original extension
                 output_dir = os.path.dirname(output_file)
@@ -162,13 +343,7 @@ class CryptoManager:
                 
                 try:
                     with open(final_output, 'wb') as outfile:
-                        while chunk := infile.read(CHUNK_SIZE):
-                            try:
-                                decrypted_chunk = decryptor.update(chunk)
-                                outfile.write(decrypted_chunk)
-                            except Exception:
-                                raise ValueError("Decryption failed: Invalid key")
-                        outfile.write(decryptor.finalize())
+                        self._decrypt_stream(infile, decryptor, outfile.write)
                     
                     # Execute post-decryption hook
                     self.execute_hook(
@@ -199,6 +374,66 @@ class CryptoManager:
         except (ValueError, struct.error) as e:
             raise ValueError(str(e))
 
+    @staticmethod
+    def _decrypt_stream(infile, decryptor, sink) -> None:
+        """Decrypt the rest of infile in CHUNK_SIZE pieces, passing the plaintext to sink.
+        
+        The ciphertext is memory-mapped and its slices are handed straight
+        to update_into(), so it is never copied into Python buffers and
+        the OS pages it in on demand. The output buffer is allocated once
+        and reused. sink must consume the data before returning.
+        """
+        # update_into() needs room for one block beyond the input
+        out_buf = bytearray(CHUNK_SIZE + 15)
+        out_view = memoryview(out_buf)
+        start = infile.tell()
+        # Maps must start on a page boundary, so map the whole file and
+        # skip the header; a file ending at the header has nothing to map
+        if start < os.fstat(infile.fileno()).st_size:
+            with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                for offset in range(start, len(view), CHUNK_SIZE):
+                    with view[offset:offset + CHUNK_SIZE] as chunk:
+                        sink(out_view[:decryptor.update_into(chunk, out_buf)])
+            drop_page_cache(infile.fileno())
+        sink(decryptor.finalize())
+
+    @staticmethod
+    def _open_decryptor(infile, factory: CipherFactory, require_integrity: bool = False) -> tuple:
+        """Read the StegeCrypt header, returning the original extension and a decryptor.
+        
+        For GCM files the decryptor's finalize() raises if the key is wrong
+        or the file has been tampered with. Legacy CFB files can't be
+        checked, so they are rejected if require_integrity is set.
+        """
+        # Verify file format
+        magic = infile.read(len(MAGIC_BYTES))
+        if magic not in (MAGIC_BYTES, MAGIC_BYTES_GCM):
+            raise ValueError("Invalid file format or not a StegeCrypt file")
+        
+        # Read original extension
+        ext_length_bytes = infile.read(4)
+        ext_length = struct.unpack('<I', ext_length_bytes)[0]
+        ext_bytes = infile.read(ext_length)
+        ext = ext_bytes.decode('utf-8')
+        
+        if magic == MAGIC_BYTES:
+            if require_integrity:
+                raise ValueError(
+                    "Legacy StegeCrypt file without an integrity tag, so its "
+                    "contents can't be verified. Untick \"Verify file integrity\" "
+                    "to decrypt it anyway"
+                )
+            # Legacy files carry a 16 byte IV and no authentication
+            return ext, factory.cfb(infile.read(16)).decryptor()
+        
+        # Read nonce and tag
+        iv = infile.read(NONCE_SIZE)
+        tag = infile.read(TAG_SIZE)
+        decryptor = factory.gcm(iv, tag).decryptor()
+        decryptor.authenticate_additional_data(magic + ext_length_bytes + ext_bytes)
+        return ext, decryptor
+
 # Create global crypto manager instance
 crypto_manager = None
 
@@ -208,14 +443,55 @@ def init_crypto_manager(plugin_manager=None):
     crypto_manager = CryptoManager(plugin_manager)
     return crypto_manager
 
-def encrypt_file(input_file: str, key_file: str, output_file: str) -> None:
+def make_cipher_factory(key_file: str) -> CipherFactory:
+    """Global cipher factory function."""
+    if not crypto_manager:
+        raise RuntimeError("Crypto manager not initialized")
+    return crypto_manager.make_cipher_factory(key_file)
+
+def encrypt_file(input_file: str, key_file: Union[str, CipherFactory], output_file: str) -> None:
     """Global encrypt file function."""
     if not crypto_manager:
         raise RuntimeError("Crypto manager not initialized")
     return crypto_manager.encrypt_file(input_file, key_file, output_file)
 
-def decrypt_file(input_file: str, key_file: str, output_file: str) -> str:
+def decrypt_file(input_file: str, key_file: Union[str, CipherFactory], output_file: str,
+                 require_integrity: bool = False) -> str:
     """Global decrypt file function."""
     if not crypto_manager:
         raise RuntimeError("Crypto manager not initialized")
-    return crypto_manager.decrypt_file(input_file, key_file, output_file)
\ No newline at end of file
+    return crypto_manager.decrypt_file(input_file, key_file, output_file, require_integrity)
+
+def encrypt_bytes(data: bytes, input_file: str, key_file: Union[str, CipherFactory], output_file: str) -> None:
+    """Global encrypt-bytes function."""
+    if not crypto_manager:
+        raise RuntimeError("Crypto manager not initialized")
+    return crypto_manager.encrypt_bytes(data, input_file, key_file, output_file)
+
+def encrypt_and_hash(input_file: str, key_file: Union[str, CipherFactory], output_file: str,
+                     data: Optional[bytes] = None) -> str:
+    """Global encrypt-and-hash function."""
+    if not crypto_manager:
+        raise RuntimeError("Crypto manager not initialized")
+    return crypto_manager.encrypt_and_hash(input_file, key_file, output_file, data)
+
+def file_hooks_active() -> bool:
+    """Report whether plugins watch per-file encryption or decryption.
+    
+    Those hooks only run in this process, so batches must not be handed
+    to worker processes while any are registered.
+    """
+    if not crypto_manager:
+        raise RuntimeError("Crypto manager not initialized")
+    return crypto_manager.has_listeners(
+        HookPoint.PRE_ENCRYPTION_ALGORITHM.value,
+        HookPoint.POST_ENCRYPTION_ALGORITHM.value
+    )
+
+def decrypt_worker(input_file: str, key: bytes, output_path: str, require_integrity: bool = False) -> str:
+    """Decrypt one file in a worker process with an already-derived key.
+    
+    The global crypto manager is not set up in worker processes, so a
+    plugin-free manager is used; callers check file_hooks_active() first.
+    """
+    return CryptoManager().decrypt_file(input_file, CipherFactory(key), output_path, require_integrity)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import os
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -5,18 +6,21 @@ from datetime import datetime
 def cleanup_logs(log_dir: Path, max_logs: int = 2) -> None:
     """Clean up old log files."""
     try:
+        # One directory pass; scandir entries carry their stat results
         log_files = []
-        for log_file in log_dir.glob("stegecrypt_*.log"):
-            try:
-                creation_time = os.path.getctime(log_file)
-                log_files.append((creation_time, log_file))
-            except OSError:
-                continue
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith("stegecrypt_") and entry.name.endswith(".log")):
+                    continue
+                try:
+                    log_files.append((entry.stat().st_ctime, entry.path))
+                except OSError:
+                    continue
 
         log_files.sort(reverse=True)
         for _, log_file in log_files[max_logs:]:
             try:
-                log_file.unlink()
+                os.remove(log_file)
             except OSError:
                 continue
     except Exception as e:
@@ -159,6 +159,27 @@ class PluginManager:
                     self.logger.error(f"Error executing hook {hook_point}: {str(e)}")
         return results
     
+    def execute_hooks_bulk(self, calls: List[tuple]) -> List[List[Any]]:
+        """Execute several hook points in a single pass.
+        
+        Takes (hook_point, kwargs) pairs and returns one result list per
+        pair, in the same order.
+        """
+        batch = []
+        for hook_point, kwargs in calls:
+            results = []
+            for handler in self.hooks.get(hook_point, ()):
+                try:
+                    results.append(handler(**kwargs))
+                except Exception as e:
+                    self.logger.error(f"Error executing hook {hook_point}: {str(e)}")
+            batch.append(results)
+        return batch
+    
+    def has_listeners(self, hook_point: str) -> bool:
+        """Check whether any handler is registered for a hook point."""
+        return bool(self.hooks.get(hook_point))
+    
     def enable_plugin(self, plugin_name: str) -> bool:
         """Enable a plugin dynamically."""
         plugin = self.plugins.get(plugin_name)
@@ -12,6 +12,10 @@ class SettingsManager:
             "max_logs": 2,
             "file_logging": True,
             "console_logging": True
+        },
+        "encryption": {
+            # None until the user is first asked about hashing large files
+            "hash_large_files": None
         }
     }
     
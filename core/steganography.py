@@ -1,9 +1,10 @@
 from PIL import Image
 import numpy as np
-from core.utils import validate_file, log_progress
+import struct
+from multiprocessing import shared_memory
+from core.utils import validate_file
 from core.plugin_system.plugin_base import HookPoint
 import os
-from datetime import datetime
 
 MAGIC_MARKER = "STEGO2024"  # Clear marker for data validation
 CHUNK_SIZE = 1024 * 1024  # 1MB chunks for processing
@@ -27,6 +28,21 @@ def bits_to_str(bits):
     except Exception as e:
         raise SteganographyError(f"Failed to convert bits to string: {str(e)}")
 
+def _lsb_embed(channels: np.ndarray, bits: np.ndarray) -> None:
+    """Write a 0/1 uint8 bit array into the LSBs of the first channel values, in place."""
+    # Work on a view with out= so no payload-sized temporaries are made
+    head = channels[:len(bits)]
+    np.bitwise_and(head, 0xFE, out=head)
+    np.bitwise_or(head, bits, out=head)
+
+def _lsb_extract(channels: np.ndarray, start: int, count: int) -> np.ndarray:
+    """Return the LSBs of channels[start:start + count] as a 0/1 uint8 array."""
+    return channels[start:start + count] & 1
+
+def _bit_array_to_bits(bits: np.ndarray) -> str:
+    """Convert a 0/1 uint8 array into a '0'/'1' bit string."""
+    return (bits + ord('0')).tobytes().decode('ascii')
+
 def validate_image_format(filepath: str) -> bool:
     """Validate if the image format is supported."""
     ext = os.path.splitext(filepath.lower())[1]
@@ -36,38 +52,59 @@ def verify_stego_data(image_path: str) -> bool:
     """Verify if an image contains steganographic data."""
     try:
         img = Image.open(image_path)
-        img = img.convert('RGB')
-        pixels = list(img.getdata())
-        
-        # Calculate how many pixels we need for the marker
-        marker_bits_needed = len(MAGIC_MARKER) * 8
-        pixels_needed = (marker_bits_needed + 2) // 3  # Round up to nearest pixel
-        
-        # Get bits for the marker
-        extracted_bits = ''
-        for i in range(pixels_needed):
-            r, g, b = pixels[i]
-            extracted_bits += str(r & 1)
-            extracted_bits += str(g & 1)
-            extracted_bits += str(b & 1)
-            
-            if len(extracted_bits) >= marker_bits_needed:
-                break
-        
-        # Trim to exact marker length
-        marker_bits = extracted_bits[:marker_bits_needed]
-        try:
-            marker = bits_to_str(marker_bits)
-            print(f"Debug - Found marker: {marker}")
-            print(f"Debug - Raw marker bits: {marker_bits}")
-            return marker == MAGIC_MARKER
-        except Exception as e:
-            print(f"Debug - Marker extraction failed: {str(e)}")
-            print(f"Debug - Raw bits: {marker_bits}")
-            return False
+        channels = np.asarray(img.convert('RGB'), dtype=np.uint8).reshape(-1)
     except Exception as e:
         print(f"Debug - Image processing failed: {str(e)}")
         return False
+    return verify_stego_array(channels)
+
+def verify_stego_array(channels: np.ndarray) -> bool:
+    """Verify if a flattened RGB channel array carries the stego marker.
+    
+    Lets the embedder check its own output without decoding the PNG it
+    has just written.
+    """
+    marker_bits_needed = len(MAGIC_MARKER) * 8
+    if channels.size < marker_bits_needed:
+        return False
+    
+    marker_bits = _bit_array_to_bits(_lsb_extract(channels, 0, marker_bits_needed))
+    try:
+        marker = bits_to_str(marker_bits)
+        print(f"Debug - Found marker: {marker}")
+        print(f"Debug - Raw marker bits: {marker_bits}")
+        return marker == MAGIC_MARKER
+    except Exception as e:
+        print(f"Debug - Marker extraction failed: {str(e)}")
+        print(f"Debug - Raw bits: {marker_bits}")
+        return False
+
+def load_carrier(image_path: str) -> np.ndarray:
+    """Decode a carrier image into a (height, width, 3) uint8 RGB array."""
+    validate_file(image_path)
+    print(f"Debug - Image: {image_path}")
+    
+    # Validate image format
+    if not validate_image_format(image_path):
+        raise SteganographyError(
+            "Unsupported image format. Supported formats: PNG, BMP, JPEG, TIFF, GIF"
+        )
+    
+    try:
+        img = Image.open(image_path)
+        print(f"Debug - Image format: {img.format}")
+        print(f"Debug - Image mode: {img.mode}")
+        
+        # Special handling for GIF animations
+        if img.format == 'GIF' and getattr(img, 'is_animated', False):
+            print("Note: For animated GIFs, only the first frame will be used.")
+            img.seek(0)
+        
+        carrier = np.asarray(img.convert('RGB'), dtype=np.uint8)
+        print(f"Debug - Image dimensions: {carrier.shape[1]}x{carrier.shape[0]}")
+        return carrier
+    except Exception as e:
+        raise SteganographyError(f"Failed to process image: {str(e)}")
 
 class StegoManager:
     """Manager class for steganography operations."""
@@ -79,43 +116,27 @@ class StegoManager:
     def embed(self, image_path: str, data_path: str, output_path: str) -> str:
         """Embed data into an image."""
         try:
-            validate_file(image_path)
+            carrier = load_carrier(image_path)
+        except Exception as e:
+            raise SteganographyError(f"Failed to embed data: {str(e)}")
+        return self.embed_prepared(carrier, data_path, output_path)
+    
+    def embed_prepared(self, carrier: np.ndarray, data_path: str, output_path: str) -> str:
+        """Embed data into a carrier already decoded by load_carrier().
+        
+        The carrier array is left untouched, so one decode can serve any
+        number of embeds.
+        """
+        try:
             validate_file(data_path)
             
             print(f"\nDebug - Starting embedding process")
-            print(f"Debug - Image: {image_path}")
             print(f"Debug - Data file: {data_path}")
             
-            # Validate image format
-            if not validate_image_format(image_path):
-                raise SteganographyError(
-                    "Unsupported image format. Supported formats: PNG, BMP, JPEG, TIFF, GIF"
-                )
-            
-            # Read and prepare the image
-            try:
-                img = Image.open(image_path)
-                print(f"Debug - Image format: {img.format}")
-                print(f"Debug - Image mode: {img.mode}")
-                
-                # Special handling for GIF animations
-                if img.format == 'GIF' and getattr(img, 'is_animated', False):
-                    print("Note: For animated GIFs, only the first frame will be used.")
-                    img.seek(0)
-                
-                img = img.convert('RGB')
-                width, height = img.size
-                pixels = list(img.getdata())
-                print(f"Debug - Image dimensions: {width}x{height}")
-                print(f"Debug - Total pixels: {len(pixels)}")
-            except Exception as e:
-                raise SteganographyError(f"Failed to process image: {str(e)}")
+            height, width = carrier.shape[:2]
             
-            # Generate output filename - always use PNG for output
-            output_dir = os.path.dirname(output_path)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_name = f"stega_{timestamp}.png"  # Force PNG
-            output_path = os.path.join(output_dir, output_name)
+            # Always use PNG for output; a lossy format would destroy the LSBs
+            output_path = os.path.splitext(output_path)[0] + '.png'
             
             # Prepare file data and extension
             _, ext = os.path.splitext(data_path)
@@ -129,88 +150,50 @@ class StegoManager:
             print(f"Debug - File size: {len(file_data)} bytes")
             print(f"Debug - File extension: {ext}")
             
-            # Convert marker to bits
-            marker_bits = str_to_bits(MAGIC_MARKER)
-            print(f"Debug - Marker bits length: {len(marker_bits)}")
-            print(f"Debug - Marker bits: {marker_bits}")
-            
-            # Convert extension to bits
-            ext_bits = str_to_bits(ext)
-            ext_length_bits = int_to_bits(len(ext_bits), 32)
-            print(f"Debug - Extension bits length: {len(ext_bits)}")
-            
-            # Convert file data to bits
-            data_bits = ''.join(format(b, '08b') for b in file_data)
-            data_length_bits = int_to_bits(len(file_data), 32)
-            
-            # Combine all bits with clear markers
-            all_bits = (
-                marker_bits +           # Magic marker
-                ext_length_bits +       # Length of extension in bits
-                ext_bits +             # Extension bits
-                data_length_bits +     # Length of data in bytes
-                data_bits              # Actual data bits
+            # Build the byte layout: marker | extension length in bits
+            # (32-bit big-endian) | extension | data length in bytes
+            # (32-bit big-endian) | data
+            marker_bytes = MAGIC_MARKER.encode('ascii')
+            ext_bytes = ext.encode('latin-1')
+            payload = (
+                marker_bytes +
+                struct.pack('>I', len(ext_bytes) * 8) +
+                ext_bytes +
+                struct.pack('>I', len(file_data)) +
+                file_data
             )
             
+            # Unpack to one bit per element, most significant bit first
+            bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+            
             print(f"Debug - Total embedding structure:")
-            print(f"  - Marker: {len(marker_bits)} bits")
-            print(f"  - Extension length: {len(ext_length_bits)} bits")
-            print(f"  - Extension: {len(ext_bits)} bits")
-            print(f"  - Data length: {len(data_length_bits)} bits")
-            print(f"  - Data: {len(data_bits)} bits")
-            print(f"  - Total: {len(all_bits)} bits")
+            print(f"  - Marker: {len(marker_bytes) * 8} bits")
+            print(f"  - Extension length: 32 bits")
+            print(f"  - Extension: {len(ext_bytes) * 8} bits")
+            print(f"  - Data length: 32 bits")
+            print(f"  - Data: {len(file_data) * 8} bits")
+            print(f"  - Total: {len(bits)} bits")
             
             # Check if image is large enough
-            available_bits = len(pixels) * 3
+            available_bits = carrier.size
             print(f"Debug - Available bits in image: {available_bits}")
-            if len(all_bits) > available_bits:
+            if len(bits) > available_bits:
                 raise SteganographyError(
-                    f"Image too small. Needs {len(all_bits)} bits but only has {available_bits} available."
+                    f"Image too small. Needs {len(bits)} bits but only has {available_bits} available."
                 )
             
-            # Embed data
-            new_pixels = []
-            bit_index = 0
-            total_bits = len(all_bits)
-            
-            for i in range(len(pixels)):
-                r, g, b = pixels[i]
-                new_r, new_g, new_b = r, g, b
-                
-                # Modify each color channel if we still have bits to embed
-                if bit_index < total_bits:
-                    new_r = (r & ~1) | int(all_bits[bit_index])
-                    bit_index += 1
-                    
-                if bit_index < total_bits:
-                    new_g = (g & ~1) | int(all_bits[bit_index])
-                    bit_index += 1
-                    
-                if bit_index < total_bits:
-                    new_b = (b & ~1) | int(all_bits[bit_index])
-                    bit_index += 1
-                
-                new_pixels.append((new_r, new_g, new_b))
-                
-                if bit_index >= total_bits:
-                    # Add remaining pixels unchanged
-                    new_pixels.extend(pixels[i+1:])
-                    break
-                
-                if bit_index % 1000000 == 0:
-                    log_progress(bit_index, total_bits)
-            
-            # Add remaining pixels unchanged
-            new_pixels.extend(pixels[len(new_pixels):])
+            # Embed data into the LSB of each channel value, in R, G, B
+            # pixel order, on a private copy of the carrier
+            channels = carrier.reshape(-1).copy()
+            _lsb_embed(channels, bits)
             
             # Create and save new image as PNG
-            new_img = Image.new('RGB', (width, height))
-            new_img.putdata(new_pixels)
+            new_img = Image.fromarray(channels.reshape(height, width, 3), 'RGB')
             new_img.save(output_path, 'PNG', optimize=False, compress_level=0)
             
             # Verify the embedding
             print("\nDebug - Verifying embedded data...")
-            if verify_stego_data(output_path):
+            if verify_stego_array(channels):
                 print("Debug - Verification successful!")
             else:
                 print("Debug - WARNING: Verification failed!")
@@ -244,35 +227,34 @@ class StegoManager:
                 if img.format == 'GIF' and getattr(img, 'is_animated', False):
                     img.seek(0)  # Use first frame for animated GIFs
                     
-                img = img.convert('RGB')
-                pixels = list(img.getdata())
-                available_bits = len(pixels) * 3  # Total available bits
-                print(f"Debug - Total pixels: {len(pixels)}")
+                # convert() copies even when the mode already matches, so
+                # RGB images are read without it
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+                
+                # One LSB per channel value, in R, G, B pixel order
+                channels = np.asarray(img, dtype=np.uint8).reshape(-1)
+                available_bits = channels.size  # Total available bits
+                print(f"Debug - Total pixels: {available_bits // 3}")
                 print(f"Debug - Available bits: {available_bits}")
             except Exception as e:
                 raise SteganographyError(f"Failed to process image: {str(e)}")
             
+            def read_bits(start: int, count: int) -> str:
+                """Read count embedded bits starting at bit offset start."""
+                if start + count > available_bits:
+                    raise SteganographyError("Unexpected end of image data")
+                return _bit_array_to_bits(_lsb_extract(channels, start, count))
+            
             # Extract initial bits
-            extracted_bits = ''
             marker_length = len(MAGIC_MARKER) * 8
             min_header_bits = marker_length + 32  # Marker + ext length
-            pixels_needed = (min_header_bits + 2) // 3  # Round up to nearest pixel
+            if min_header_bits > available_bits:
+                raise SteganographyError("Image too small to contain valid data")
             
-            print(f"Debug - Extracting initial {min_header_bits} bits from {pixels_needed} pixels")
-            
-            for i in range(pixels_needed):
-                if i >= len(pixels):
-                    raise SteganographyError("Image too small to contain valid data")
-                r, g, b = pixels[i]
-                extracted_bits += str(r & 1)
-                extracted_bits += str(g & 1)
-                extracted_bits += str(b & 1)
-                
-                if len(extracted_bits) >= min_header_bits:
-                    break
-                    
-            print(f"Debug - Extracted {len(extracted_bits)} initial bits")
-            print(f"Debug - First {min_header_bits} bits: {extracted_bits[:min_header_bits]}")
+            print(f"Debug - Extracting initial {min_header_bits} bits")
+            extracted_bits = read_bits(0, min_header_bits)
+            print(f"Debug - First {min_header_bits} bits: {extracted_bits}")
             
             # Verify magic marker
             marker_bits = extracted_bits[:marker_length]
@@ -298,18 +280,8 @@ class StegoManager:
                 raise SteganographyError("Invalid extension length")
             current_pos += 32
             
-            # Extract more bits if needed for extension
-            while len(extracted_bits) < current_pos + ext_length:
-                pixel_index = len(extracted_bits) // 3
-                if pixel_index >= len(pixels):
-                    raise SteganographyError("Unexpected end of image data")
-                r, g, b = pixels[pixel_index]
-                extracted_bits += str(r & 1)
-                extracted_bits += str(g & 1)
-                extracted_bits += str(b & 1)
-            
             # Read extension
-            ext_bits = extracted_bits[current_pos:current_pos + ext_length]
+            ext_bits = read_bits(current_pos, ext_length)
             try:
                 extension = bits_to_str(ext_bits)
                 print(f"Debug - Found extension: {extension}")
@@ -321,18 +293,8 @@ class StegoManager:
                 extension = '.bin'
             current_pos += ext_length
             
-            # Make sure we have enough bits for data length
-            while len(extracted_bits) < current_pos + 32:
-                pixel_index = len(extracted_bits) // 3
-                if pixel_index >= len(pixels):
-                    raise SteganographyError("Unexpected end of image data")
-                r, g, b = pixels[pixel_index]
-                extracted_bits += str(r & 1)
-                extracted_bits += str(g & 1)
-                extracted_bits += str(b & 1)
-            
             # Read data length
-            data_length_bits = extracted_bits[current_pos:current_pos + 32]
+            data_length_bits = read_bits(current_pos, 32)
             data_length = bits_to_int(data_length_bits)
             print(f"Debug - Data length: {data_length} bytes")
             current_pos += 32
@@ -347,34 +309,18 @@ class StegoManager:
             
             # Extract data bits
             print("Debug - Extracting data bits...")
-            needed_pixels = (required_bits + 2) // 3  # Round up to nearest pixel
-            for pixel_index in range(len(extracted_bits) // 3, needed_pixels):
-                if pixel_index >= len(pixels):
-                    raise SteganographyError("Unexpected end of image data")
-                r, g, b = pixels[pixel_index]
-                extracted_bits += str(r & 1)
-                extracted_bits += str(g & 1)
-                extracted_bits += str(b & 1)
-                
-                if pixel_index % 100000 == 0:
-                    progress = (len(extracted_bits) / required_bits) * 100
-                    log_progress(progress, 100)
+            data_bits = _lsb_extract(channels, current_pos, data_length * 8)
             
-            # Extract data bytes
-            data_bits = extracted_bits[current_pos:current_pos + (data_length * 8)]
+            # Pack the bits back into bytes, most significant bit first
             try:
-                data = bytes(bits_to_int(data_bits[i:i+8]) 
-                           for i in range(0, len(data_bits), 8))
+                data = np.packbits(data_bits).tobytes()
                 print(f"Debug - Successfully converted {len(data)} bytes of data")
             except Exception as e:
                 print(f"Debug - Failed to convert data bits: {str(e)}")
                 raise SteganographyError(f"Failed to convert data bits: {str(e)}")
             
-            # Generate output filename
-            output_dir = os.path.dirname(output_path)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_name = f"extracted_{timestamp}{extension}"
-            final_output = os.path.join(output_dir, output_name)
+            # Use the requested path with the embedded file's extension
+            final_output = os.path.splitext(output_path)[0] + extension
             
             # Save extracted data
             try:
@@ -408,8 +354,53 @@ def embed_in_image(image_path: str, data_path: str, output_path: str) -> str:
         raise RuntimeError("Stego manager not initialized")
     return stego_manager.embed(image_path, data_path, output_path)
 
+def embed_in_image_prepared(carrier: np.ndarray, data_path: str, output_path: str) -> str:
+    """Global embed function for a carrier decoded by load_carrier()."""
+    if not stego_manager:
+        raise RuntimeError("Stego manager not initialized")
+    return stego_manager.embed_prepared(carrier, data_path, output_path)
+
 def extract_from_image(image_path: str, output_path: str) -> str:
     """Global extract function."""
     if not stego_manager:
         raise RuntimeError("Stego manager not initialized")
-    return stego_manager.extract(image_path, output_path)
\ No newline at end of file
+    return stego_manager.extract(image_path, output_path)
+
+# Worker process entry points. StegoManager fires no per-file plugin hooks
+# (only STEGO_INIT, which the global manager has already fired), so the
+# plugin-free managers below behave exactly like the in-process one; the
+# PRE/POST_EMBED and PRE/POST_EXTRACT hooks are run by the caller for
+# every file either way.
+
+def share_carrier(carrier: np.ndarray) -> shared_memory.SharedMemory:
+    """Copy a decoded carrier into a new shared memory block.
+    
+    Workers attach to it through init_embed_worker(), so the carrier is
+    decoded once by the caller and never copied per process. The caller
+    must close() and unlink() the block once the pool has shut down.
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(carrier.nbytes, 1))
+    view = np.ndarray(carrier.shape, dtype=np.uint8, buffer=shm.buf)
+    view[...] = carrier
+    del view  # close() fails while views of the buffer exist
+    return shm
+
+# Carrier attached by init_embed_worker(), and the block that backs it
+_worker_carrier = None
+_worker_shm = None
+
+def init_embed_worker(shm_name: str, shape: tuple):
+    """Attach to the carrier shared by share_carrier() when a worker process starts."""
+    global _worker_carrier, _worker_shm
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_carrier = np.ndarray(shape, dtype=np.uint8, buffer=_worker_shm.buf)
+    # Shared by every worker; embed_prepared() only reads it
+    _worker_carrier.flags.writeable = False
+
+def embed_worker(data_file: str, output_path: str) -> str:
+    """Embed one data file into the carrier from init_embed_worker()."""
+    return StegoManager().embed_prepared(_worker_carrier, data_file, output_path)
+
+def extract_worker(image_file: str, output_path: str) -> str:
+    """Extract hidden data from one image in a worker process."""
+    return StegoManager().extract(image_file, output_path)
\ No newline at end of file
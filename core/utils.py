@@ -1,13 +1,24 @@
 import os
+import mmap
 import hashlib
+import multiprocessing
 import sys
+import time
 import random
 import string
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import secrets
 from typing import Optional
 from .plugin_system.plugin_base import HookPoint
 
+# Largest slice of a file overwritten at once by secure_delete
+SECURE_DELETE_WINDOW = 256 * 1024 * 1024
+# Attempts, and seconds between them, for file operations Windows rejects
+# while another handle to the file is still being released
+IN_USE_ATTEMPTS = 3
+IN_USE_DELAY = 0.5
+
 class UtilsManager:
     """Manages utility operations with plugin support."""
     
@@ -44,16 +55,13 @@ class UtilsManager:
             else:
                 raise ValueError("Unsupported hash type")
 
-            file_size = os.path.getsize(file_path)
-            processed_size = 0
-            
+            # Hash the memory-mapped file in one call, letting the kernel
+            # page it in on demand (empty files cannot be mapped)
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(65536), b""):
-                    hasher.update(chunk)
-                    processed_size += len(chunk)
-                    progress = (processed_size / file_size) * 100
-                    sys.stdout.write(f"\rComputing hash: {progress:.1f}%")
-                    sys.stdout.flush()
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        hasher.update(mm)
+                drop_page_cache(f.fileno())
             
             hash_value = hasher.hexdigest()
             
@@ -75,50 +83,50 @@ class UtilsManager:
             raise ValueError(f"Failed to compute hash: {str(e)}")
     
     def secure_delete(self, file_path: str, passes: int = 3) -> bool:
-        """Securely delete a file by overwriting it multiple times."""
+        """Securely delete a file by overwriting it multiple times.
+        
+        Callers deleting a batch should release their own handles first
+        (e.g. one gc.collect() for the whole batch) rather than per file.
+        """
         if not os.path.exists(file_path):
             return False
 
         try:
             file_size = os.path.getsize(file_path)
             
-            # Force garbage collection to release file handles
-            import gc
-            gc.collect()
+            # Overwrite the file in place through a memory map; each pass is
+            # a few large slice assignments rather than a 64KB write loop
+            with _open_when_free(file_path, "r+b") as f:
+                if file_size:  # Empty files cannot be memory-mapped
+                    with mmap.mmap(f.fileno(), 0) as mm:
+                        window = min(SECURE_DELETE_WINDOW, file_size)
+                        for pass_num in range(passes):
+                            # Use different patterns for each pass
+                            if pass_num == 1:
+                                pattern = bytes(window)          # All zeros
+                            elif pass_num > 1:
+                                pattern = b'\xFF' * window       # All ones
+                            for offset in range(0, file_size, window):
+                                end = min(offset + window, file_size)
+                                if pass_num == 0:
+                                    mm[offset:end] = os.urandom(end - offset)  # Random data
+                                else:
+                                    mm[offset:end] = pattern[:end - offset]
+                            
+                            # Force write to disk
+                            mm.flush()
+                            os.fsync(f.fileno())
             
-            import time
-            time.sleep(0.1)  # Small delay to ensure file handles are released
-            
-            # Perform overwrite passes
-            for pass_num in range(passes):
-                with open(file_path, "wb") as f:
-                    # Use different patterns for each pass
-                    for chunk in range(0, file_size, 65536):  # 64KB chunks
-                        write_size = min(65536, file_size - chunk)
-                        if pass_num == 0:
-                            f.write(os.urandom(write_size))  # Random data
-                        elif pass_num == 1:
-                            f.write(b'\x00' * write_size)    # All zeros
-                        else:
-                            f.write(b'\xFF' * write_size)    # All ones
-                        
-                    # Force write to disk
-                    f.flush()
-                    os.fsync(f.fileno())
-            
-            # Close file handle and wait
-            time.sleep(0.1)
-            
-            # Multiple deletion attempts
-            max_attempts = 3
-            for attempt in range(max_attempts):
+            # Multiple deletion attempts; on Windows the handle behind the
+            # map above can take a moment to go away after it is closed
+            for attempt in range(IN_USE_ATTEMPTS):
                 try:
                     os.remove(file_path)
                     if not os.path.exists(file_path):
                         return True
                 except Exception:
-                    if attempt < max_attempts - 1:
-                        time.sleep(0.5)
+                    if attempt < IN_USE_ATTEMPTS - 1:
+                        time.sleep(IN_USE_DELAY)
                         continue
                     raise
             
@@ -199,6 +207,48 @@ def validate_file(file_path):
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
+def _open_when_free(file_path: str, mode: str):
+    """Open a file, retrying briefly while Windows reports it as in use.
+    
+    Windows refuses access while another handle to the file is open, e.g.
+    one the encryptor has only just closed, or a virus scanner or the
+    search indexer looking at a new file. Without a retry secure_delete
+    would fall back to deleting the file without overwriting it.
+    """
+    for attempt in range(IN_USE_ATTEMPTS):
+        try:
+            return open(file_path, mode)
+        except PermissionError:
+            if sys.platform != 'win32' or attempt == IN_USE_ATTEMPTS - 1:
+                raise
+            time.sleep(IN_USE_DELAY)
+
+def drop_page_cache(fd: int) -> None:
+    """Advise the OS that a file's cached pages won't be needed again.
+    
+    Batches touch each file once, so without this the page cache fills
+    with data nobody will read back. Dirty pages are only queued for
+    writeback, not dropped. Does nothing where posix_fadvise is missing.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+def process_pool(max_workers: int, **kwargs) -> ProcessPoolExecutor:
+    """Create a process pool whose workers start from a fresh interpreter.
+    
+    The GUI process runs several threads, and forking a threaded process
+    can leave locks held in the child (Python 3.12+ warns about it), so
+    the spawn start method is always used instead of the platform default.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        **kwargs
+    )
+
 def log_progress(current, total):
     """Display a progress bar."""
     percentage = (current / total) * 100
@@ -142,6 +142,14 @@ class StegeCryptGUI:
         """Setup the global status bar."""
         self.status_bar = StatusBar(self.main_container, self.plugin_manager)
         self.status_bar.frame.grid(row=3, column=0, sticky='ew', pady=(5, 0))
+        
+        # Hardware AES is what keeps bulk encryption fast; tell the user
+        # up front if it is missing
+        from core.aes_crypt import has_aes_ni
+        self._aes_ni = has_aes_ni()
+        if self._aes_ni is False:
+            logging.warning("CPU has no AES instructions; encryption will use software AES")
+            self.status_bar.set_warning("AES-NI not available - encryption will be slower")
     
     def setup_tooltips(self):
         """Setup tooltips for various UI elements."""
@@ -150,19 +158,23 @@ class StegeCryptGUI:
         # Add tooltips to tabs
         create_tooltip(
             self.encrypt_tab.frame,
-            "Encrypt files using AES-256 encryption.\nSupports multiple file selection."
+            "Encrypt files using AES-256 encryption.\nSupports multiple file selection.",
+            plugin_manager=self.plugin_manager
         )
         create_tooltip(
             self.decrypt_tab.frame,
-            "Decrypt previously encrypted files.\nRequires the original key file."
+            "Decrypt previously encrypted files.\nRequires the original key file.",
+            plugin_manager=self.plugin_manager
         )
         create_tooltip(
             self.embed_tab.frame,
-            "Hide encrypted data within an image using steganography."
+            "Hide encrypted data within an image using steganography.",
+            plugin_manager=self.plugin_manager
         )
         create_tooltip(
             self.extract_tab.frame,
-            "Extract hidden data from an image that contains embedded information."
+            "Extract hidden data from an image that contains embedded information.",
+            plugin_manager=self.plugin_manager
         )
     
     def run(self):
@@ -58,8 +58,9 @@ class FileListInput:
         else:
             files = filedialog.askopenfilenames()
         
-        for file in files:
-            self.listbox.insert('end', file)
+        # One Tcl call for the whole selection instead of one per file
+        if files:
+            self.listbox.insert('end', *files)
             
         if self.on_change:
             self.on_change(self.get())
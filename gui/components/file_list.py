@@ -95,8 +95,9 @@ class FileList:
             if results and isinstance(results[0], list):
                 files = results[0]
         
-        for file in files:
-            self.listbox.insert('end', file)
+        # One Tcl call for the whole selection instead of one per file
+        if files:
+            self.listbox.insert('end', *files)
             
         if self.on_change:
             self.on_change(self.get())
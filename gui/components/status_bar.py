@@ -85,8 +85,19 @@ class StatusBar:
         # Use modified text if provided by plugin
         if results and isinstance(results[0], str):
             text = results[0]
-            
-        self.status_label.config(text=text)
+        
+        self._set_status_text(text)
+    
+    def _set_status_text(self, text: str):
+        """Show text in the status label.
+        
+        Goes through the progress manager's coalesced updates when there
+        is one, so worker threads never touch the label directly.
+        """
+        if self.progress_manager:
+            self.progress_manager.set_status(text)
+        else:
+            self.status_label.config(text=text)
 
     def update_progress(self, completed: int, total: int, status: Optional[str] = None):
         """Update progress information."""
@@ -150,7 +161,7 @@ class StatusBar:
         if results and isinstance(results[0], str):
             message = results[0]
             
-        self.status_label.config(text=f"Error: {message}")
+        self._set_status_text(f"Error: {message}")
 
     def set_warning(self, message: str):
         """Display a warning message."""
@@ -164,7 +175,7 @@ class StatusBar:
         if results and isinstance(results[0], str):
             message = results[0]
             
-        self.status_label.config(text=f"Warning: {message}")
+        self._set_status_text(f"Warning: {message}")
 
     def set_success(self, message: str):
         """Display a success message."""
@@ -178,7 +189,7 @@ class StatusBar:
         if results and isinstance(results[0], str):
             message = results[0]
             
-        self.status_label.config(text=f"Success: {message}")
+        self._set_status_text(f"Success: {message}")
 
     def add_custom_label(self, text: str, side: str = 'right', **kwargs) -> ttk.Label:
         """Allow plugins to add custom labels to the status bar."""
@@ -6,11 +6,14 @@ from core.logging_config import configure_logging
 class SettingsDialog:
     """Settings dialog for StegeCrypt."""
     
+    # Stored "hash_large_files" values and how the dialog shows them
+    HASH_LARGE_FILES_LABELS = {None: "Ask", True: "Always", False: "Never"}
+    
     def __init__(self, parent):
         self.window = tk.Toplevel(parent)
         self.window.title("Settings")
-        self.window.geometry("400x500")
-        self.window.minsize(400, 500)
+        self.window.geometry("400x580")
+        self.window.minsize(400, 580)
         
         # Main frame
         main_frame = ttk.Frame(self.window, padding=20)
@@ -61,6 +64,22 @@ class SettingsDialog:
         self.max_logs = tk.StringVar(value=str(settings_manager.get("logging", "max_logs")))
         ttk.Entry(logging_frame, textvariable=self.max_logs).pack(fill='x')
         
+        # Encryption section
+        encryption_frame = ttk.LabelFrame(main_frame, text="Encryption Settings", padding=10)
+        encryption_frame.pack(fill='x', pady=(0, 10))
+        
+        # Hashing of large files (None means ask on the next large file)
+        ttk.Label(encryption_frame, text="Compute SHA-256 for files over 1 GiB:").pack(anchor='w')
+        self.hash_large_files = tk.StringVar(
+            value=self.HASH_LARGE_FILES_LABELS.get(settings_manager.get("encryption", "hash_large_files"), "Ask")
+        )
+        ttk.Combobox(
+            encryption_frame,
+            textvariable=self.hash_large_files,
+            values=list(self.HASH_LARGE_FILES_LABELS.values()),
+            state="readonly"
+        ).pack(fill='x')
+        
         # Buttons
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(fill='x', pady=(20, 0))
@@ -93,6 +112,9 @@ class SettingsDialog:
         settings_manager.set("logging", "file_logging", self.file_logging.get())
         settings_manager.set("logging", "console_logging", self.console_logging.get())
         
+        hash_choice = {label: value for value, label in self.HASH_LARGE_FILES_LABELS.items()}
+        settings_manager.set("encryption", "hash_large_files", hash_choice[self.hash_large_files.get()])
+        
         try:
             max_logs = int(self.max_logs.get())
             settings_manager.set("logging", "max_logs", max_logs)
@@ -1,9 +1,20 @@
 from tkinter import ttk
 from .material import MaterialColors, MaterialFonts
 
+# Root window whose ttk style database has already been populated
+_styled_root = None
+
 def configure_app_style():
-    """Configure the application's ttk styles."""
+    """Configure the application's ttk styles.
+    
+    Styles live in the Tk interpreter, so they only need configuring once
+    per root window; later calls return straight away.
+    """
+    global _styled_root
     style = ttk.Style()
+    if style.master is _styled_root:
+        return style
+    _styled_root = style.master
     
     # Frame styles
     style.configure('Main.TFrame', background=MaterialColors.BG_COLOR)
@@ -42,4 +53,6 @@ def configure_app_style():
     
     # Entry styles
     style.configure('Path.TEntry',
-                   font=MaterialFonts.INPUT)
\ No newline at end of file
+                   font=MaterialFonts.INPUT)
+    
+    return style
\ No newline at end of file
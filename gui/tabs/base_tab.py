@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
+import queue
+from functools import partial
 from typing import Optional, List, Any
 from datetime import datetime
 import os
@@ -12,6 +15,8 @@ from ..components.status_bar import StatusBar
 from ..styles.material import MaterialColors
 from core.plugin_system.plugin_base import HookPoint
 
+_log = logging.getLogger(__name__)
+
 class BaseTab(ABC):
     """Abstract base class for all tabs."""
     
@@ -47,6 +52,13 @@ class BaseTab(ABC):
         self.progress_bar = ProgressBar(bottom_frame)
         self.progress_bar.frame.grid(row=0, column=0, sticky='ew', pady=(0, 5))
         
+        # Cancel button
+        ttk.Button(
+            bottom_frame,
+            text="Cancel",
+            command=self.cancel_processing
+        ).grid(row=0, column=1, sticky='e', padx=(5, 0), pady=(0, 5))
+        
         # Status bar
         self.status_bar = StatusBar(bottom_frame, self.plugin_manager)
         self.status_bar.frame.grid(row=1, column=0, sticky='ew')
@@ -62,6 +74,18 @@ class BaseTab(ABC):
         self.files_to_process: List[str] = []
         self.current_file_index = 0
         
+        # One long-lived worker per tab runs queued jobs, instead of
+        # spawning a thread for every batch
+        self._cancel_event = threading.Event()
+        self._jobs = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+        
+        # Dialogs and widget changes requested by the worker, run in order
+        # by the Tk main loop once it is idle
+        self._ui_calls = queue.Queue()
+        self._drain_scheduled = False
+        self._drain_lock = threading.Lock()
+        
         # Execute GUI tab initialization hook
         if self.plugin_manager:
             self.plugin_manager.execute_hook(
@@ -71,6 +95,30 @@ class BaseTab(ABC):
                 content_frame=self.content_frame
             )
 
+    def _add_output_dir_input(self, row: int, pady=5) -> DirectoryInput:
+        """Add the "Output Directory" picker to the content frame at the given row."""
+        output_dir = DirectoryInput(
+            self.content_frame,
+            "Output Directory"
+        )
+        output_dir.frame.grid(row=row, column=0, sticky='ew', pady=pady)
+        return output_dir
+    
+    def _add_action_button(self, row: int, text: str, command) -> ttk.Button:
+        """Add the tab's right-aligned action button to the content frame at the given row."""
+        btn_frame = ttk.Frame(self.content_frame, style='Tab.TFrame')
+        btn_frame.grid(row=row, column=0, sticky='ew', pady=10)
+        btn_frame.grid_columnconfigure(0, weight=1)  # Push button to right
+        
+        button = ttk.Button(
+            btn_frame,
+            text=text,
+            command=command,
+            style='Action.TButton'
+        )
+        button.grid(row=0, column=1, sticky='e')  # Column 1 to be on right side
+        return button
+    
     def execute_hook(self, hook_point: str, **kwargs) -> List[Any]:
         """Helper method to execute hooks with proper error handling."""
         if self.plugin_manager:
@@ -81,18 +129,42 @@ class BaseTab(ABC):
                 return []
         return []
 
-    def start_processing(self, process_func, validation_func=None):
-        """Start processing files in a separate thread."""
+    def start_processing(self, process_func, validation_func=None, snapshot_func=None):
+        """Start processing files in a separate thread.
+        
+        If snapshot_func is given it is called here, on the main thread, and
+        its result is passed to process_func, so the worker never has to
+        read Tk variables itself.
+        """
         if self.is_processing:
             messagebox.showwarning("Warning", "A process is already running")
             return
             
         if validation_func and not validation_func():
             return
+        
+        if snapshot_func:
+            process_func = partial(process_func, snapshot_func())
             
         self.is_processing = True
+        self._cancel_event.clear()
         self.status_bar.start_progress()
-        threading.Thread(target=self._process_wrapper, args=(process_func,)).start()
+        self._jobs.put(process_func)
+    
+    def _worker_loop(self):
+        """Run queued processing jobs until the None sentinel arrives."""
+        while (process_func := self._jobs.get()) is not None:
+            self._process_wrapper(process_func)
+    
+    def cancel_processing(self):
+        """Ask the running job to stop after the files already in progress."""
+        if self.is_processing:
+            self._cancel_event.set()
+            self.update_status("Cancelling...")
+    
+    def is_cancelled(self) -> bool:
+        """Return True once the user has cancelled the running job."""
+        return self._cancel_event.is_set()
     
     def _process_wrapper(self, process_func):
         """Wrapper for processing function with proper cleanup."""
@@ -104,17 +176,63 @@ class BaseTab(ABC):
             self.is_processing = False
             self.status_bar.reset()
     
+    def call_on_main_thread(self, func, *args):
+        """Run func(*args) on the Tk main thread.
+        
+        Tk is not thread-safe, so calls made from the worker are queued
+        and picked up by the main loop instead of running directly.
+        """
+        if threading.current_thread() is threading.main_thread():
+            func(*args)
+            return
+        
+        self._ui_calls.put((func, args))
+        with self._drain_lock:
+            schedule = not self._drain_scheduled
+            self._drain_scheduled = True
+        if schedule:
+            try:
+                self.frame.after_idle(self._drain_ui_calls)
+            except (RuntimeError, tk.TclError):
+                # No main loop to run it (e.g. shutting down)
+                with self._drain_lock:
+                    self._drain_scheduled = False
+    
+    def _drain_ui_calls(self):
+        """Run the calls queued by the worker (main thread only)."""
+        with self._drain_lock:
+            self._drain_scheduled = False
+        while True:
+            try:
+                func, args = self._ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception:
+                _log.exception("Error in UI callback %r", func)
+    
     def _generate_output_filename(
         self, 
         input_path: str, 
         output_dir: str, 
         suffix: str = "",
-        keep_extension: bool = True
+        keep_extension: bool = True,
+        timestamp: Optional[str] = None,
+        index: Optional[int] = None
     ) -> str:
-        """Generate an output filename with timestamp."""
+        """Generate an output filename with timestamp.
+        
+        Batches should pass one timestamp for the whole run plus each
+        file's index, so files processed within the same second can't
+        end up with the same name.
+        """
         base_name = os.path.basename(input_path)
         name, ext = os.path.splitext(base_name)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if index is not None:
+            timestamp = f"{timestamp}_{index:04d}"
         
         if keep_extension:
             return os.path.join(output_dir, f"{name}_{timestamp}{suffix}{ext}")
@@ -138,15 +256,28 @@ class BaseTab(ABC):
     
     def show_error(self, message: str):
         """Show error message."""
-        messagebox.showerror("Error", message)
+        self.call_on_main_thread(messagebox.showerror, "Error", message)
+    
+    def show_batch_errors(self, errors: List[tuple], limit: int = 20):
+        """Show one error dialog listing the (file_name, message) failures of a batch.
+        
+        Failures are collected during the loop instead of shown one at a
+        time, so the worker isn't blocked on a dialog for every bad file.
+        """
+        if not errors:
+            return
+        lines = [f"{name}: {message}" for name, message in errors[:limit]]
+        if len(errors) > limit:
+            lines.append(f"...and {len(errors) - limit} more")
+        self.show_error(f"{len(errors)} file(s) failed:\n\n" + "\n".join(lines))
     
     def show_warning(self, message: str):
         """Show warning message."""
-        messagebox.showwarning("Warning", message)
+        self.call_on_main_thread(messagebox.showwarning, "Warning", message)
     
     def show_success(self, message: str):
         """Show success message."""
-        messagebox.showinfo("Success", message)
+        self.call_on_main_thread(messagebox.showinfo, "Success", message)
     
     @abstractmethod
     def setup_ui(self):
@@ -165,6 +296,10 @@ class BaseTab(ABC):
             if hasattr(self, 'progress_bar'):
                 self.progress_bar.reset()
             
+            # Stop the worker thread
+            self._cancel_event.set()
+            self._jobs.put(None)
+            
             # Execute cleanup hook if available
             if self.plugin_manager and hasattr(HookPoint, 'TAB_CLEANUP'):
                 self.execute_hook(
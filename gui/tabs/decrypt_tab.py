@@ -1,12 +1,16 @@
 import os
 import tkinter as tk
+from concurrent.futures import as_completed
+from contextlib import closing
+from datetime import datetime
 from tkinter import ttk
 from typing import Optional
 
 from .base_tab import BaseTab
-from ..components.file_input import FileListInput, FileInput, DirectoryInput
-from core.aes_crypt import decrypt_file
+from ..components.file_input import FileListInput, FileInput
+from core.aes_crypt import CipherFactory, decrypt_file, decrypt_worker, file_hooks_active, make_cipher_factory
 from core.plugin_system.plugin_base import HookPoint
+from core.utils import process_pool
 
 class DecryptTab(BaseTab):
     """Decryption tab implementation."""
@@ -37,11 +41,7 @@ class DecryptTab(BaseTab):
         current_row += 1
         
         # Output directory
-        self.output_dir = DirectoryInput(
-            self.content_frame,
-            "Output Directory"
-        )
-        self.output_dir.frame.grid(row=current_row, column=0, sticky='ew', pady=5)
+        self.output_dir = self._add_output_dir_input(current_row)
         current_row += 1
         
         # Security options
@@ -54,25 +54,18 @@ class DecryptTab(BaseTab):
         security_frame.grid_columnconfigure(0, weight=1)
         current_row += 1
         
-        # Hash verification option
-        self.verify_hash = tk.BooleanVar(value=True)
+        # Integrity option; current files always carry a GCM tag that is
+        # checked while decrypting, legacy files have none. Off by default
+        # so files from earlier releases keep decrypting as before.
+        self.verify_integrity = tk.BooleanVar(value=False)
         ttk.Checkbutton(
             security_frame,
-            text="Verify file integrity after decryption",
-            variable=self.verify_hash
+            text="Verify file integrity (reject legacy files without an integrity tag)",
+            variable=self.verify_integrity
         ).grid(row=0, column=0, sticky='w', padx=5, pady=2)
         
         # Action button
-        btn_frame = ttk.Frame(self.content_frame, style='Tab.TFrame')
-        btn_frame.grid(row=current_row, column=0, sticky='ew', pady=10)
-        btn_frame.grid_columnconfigure(0, weight=1)
-        
-        ttk.Button(
-            btn_frame,
-            text="Decrypt Files",
-            command=self._start_decryption,
-            style='Action.TButton'
-        ).grid(row=0, column=1, sticky='e')
+        self._add_action_button(current_row, "Decrypt Files", self._start_decryption)
     
     def _validate_inputs(self) -> bool:
         """Validate all inputs before processing."""
@@ -93,71 +86,133 @@ class DecryptTab(BaseTab):
     def _start_decryption(self):
         """Start the decryption process."""
         self.files_to_process = self.file_list.get()
-        self.start_processing(self._process_decryption, self._validate_inputs)
+        self.start_processing(self._process_decryption, self._validate_inputs, self._snapshot_job)
     
-    def _process_decryption(self):
+    def _snapshot_job(self) -> dict:
+        """Capture the job's inputs from the widgets (main thread only)."""
+        return {
+            'files': list(self.files_to_process),
+            'key_file': self.key_input.get(),
+            'output_dir': self.output_dir.get(),
+            'verify_integrity': self.verify_integrity.get()
+        }
+    
+    def _process_decryption(self, job: dict):
         """Process files for decryption."""
         try:
-            total_files = len(self.files_to_process)
+            files = job['files']
+            total_files = len(files)
             success = True
+            errors = []
+            key_file = job['key_file']
+            output_dir = job['output_dir']
             
             # Execute pre-decryption hook
             self.execute_hook(
                 HookPoint.PRE_DECRYPT.value,
-                files=self.files_to_process,
-                key_file=self.key_input.get()
+                files=files,
+                key_file=key_file
             )
             
-            for i, input_file in enumerate(self.files_to_process):
-                try:
-                    file_name = os.path.basename(input_file)
-                    self.update_status(f"Decrypting {file_name}")
-                    
-                    # Generate output path and decrypt
-                    output_path = self._generate_output_filename(
-                        input_file,
-                        self.output_dir.get(),
-                        keep_extension=True
-                    )
-                    
-                    decrypt_file(
+            # Derive the key once for the whole batch
+            cipher_factory = make_cipher_factory(key_file)
+            
+            # One timestamp per run plus a per-file index, so inputs with
+            # the same name can't overwrite each other
+            run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            jobs = [
+                (
+                    input_file,
+                    self._generate_output_filename(
                         input_file,
-                        self.key_input.get(),
-                        output_path
-                    )
-                    
-                    # Execute post-decryption hook for this file
-                    self.execute_hook(
-                        HookPoint.POST_DECRYPT.value,
-                        input_file=input_file,
-                        output_file=output_path,
-                        success=True
+                        output_dir,
+                        keep_extension=True,
+                        timestamp=run_ts,
+                        index=i
                     )
+                )
+                for i, input_file in enumerate(files)
+            ]
+            
+            # Closing the runner on the way out cancels queued jobs,
+            # even when the loop breaks early
+            with closing(self._run_decrypt_jobs(jobs, cipher_factory, job['verify_integrity'])) as results:
+                for i, (input_file, output_path, error) in enumerate(results):
+                    file_name = os.path.basename(input_file)
+                    if error is None:
+                        # Execute post-decryption hook for this file
+                        self.execute_hook(
+                            HookPoint.POST_DECRYPT.value,
+                            input_file=input_file,
+                            output_file=output_path,
+                            success=True
+                        )
+                    else:
+                        self.execute_hook(
+                            HookPoint.POST_DECRYPT.value,
+                            input_file=input_file,
+                            error=str(error),
+                            success=False
+                        )
+                        errors.append((file_name, str(error)))
+                        success = False
                     
                     # Update progress
                     self.update_progress(i + 1, total_files)
                     
-                except Exception as e:
-                    self.execute_hook(
-                        HookPoint.POST_DECRYPT.value,
-                        input_file=input_file,
-                        error=str(e),
-                        success=False
-                    )
-                    self.show_error(f"Failed to decrypt {file_name}: {str(e)}")
-                    success = False
-                    continue
+                    if self.is_cancelled():
+                        self.update_status("Decryption cancelled")
+                        success = False
+                        break
+            
+            self.show_batch_errors(errors)
             
             if success:
                 self.show_success(
                     f"Successfully decrypted {total_files} files!\n\n"
-                    f"Output directory: {self.output_dir.get()}"
+                    f"Output directory: {output_dir}"
                 )
-                self.clear_fields()
+                self.call_on_main_thread(self.clear_fields)
             
         except Exception as e:
             self.show_error(str(e))
     
+    def _run_decrypt_jobs(self, jobs, cipher_factory: CipherFactory, require_integrity: bool):
+        """Decrypt each (input_file, output_path) job, yielding results as they finish.
+        
+        AES is CPU bound, so batches run in separate processes to sidestep
+        the GIL; workers get the derived key rather than re-running the
+        KDF. A single file is decrypted in-process to avoid the cost of
+        starting a pool. Plugin hooks can't run in a worker process, so
+        while any plugin handles the encryption algorithm hooks every file
+        is decrypted in-process instead, one at a time.
+        """
+        if len(jobs) == 1 or file_hooks_active():
+            for input_file, output_path in jobs:
+                self.update_status(f"Decrypting {os.path.basename(input_file)}")
+                try:
+                    yield input_file, decrypt_file(input_file, cipher_factory, output_path, require_integrity), None
+                except Exception as e:
+                    yield input_file, output_path, e
+            return
+        
+        self.update_status(f"Decrypting {len(jobs)} files")
+        with process_pool(min(len(jobs), os.cpu_count() or 1)) as executor:
+            futures = {
+                executor.submit(decrypt_worker, input_file, cipher_factory.key, output_path, require_integrity): input_file
+                for input_file, output_path in jobs
+            }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        yield futures[future], future.result(), None
+                    except Exception as e:
+                        yield futures[future], None, e
+            finally:
+                # Don't start queued jobs if the caller stopped early
+                for future in futures:
+                    future.cancel()
+    
     def clear_fields(self):
         """Clear all input fields."""
         self.file_list.clear()
@@ -1,12 +1,20 @@
 import os
 import tkinter as tk
+from concurrent.futures import as_completed
+from contextlib import closing
+from datetime import datetime
 from tkinter import ttk
 from typing import Optional
 
 from .base_tab import BaseTab
-from ..components.file_input import FileInput, FileListInput, DirectoryInput
-from core.steganography import embed_in_image
+from ..components.file_input import FileInput, FileListInput
+from core.steganography import load_carrier, embed_in_image_prepared, share_carrier, init_embed_worker, embed_worker
 from core.plugin_system.plugin_base import HookPoint
+from core.utils import process_pool
+
+# Memory that batch embeds may spend on working copies of the carrier;
+# each running job holds one, so this caps the number of workers
+EMBED_MEMORY_BUDGET = 1 << 30
 
 class EmbedTab(BaseTab):
     """Embed data tab implementation."""
@@ -44,24 +52,11 @@ class EmbedTab(BaseTab):
         current_row += 1
         
         # Output directory
-        self.output_dir = DirectoryInput(
-            self.content_frame,
-            "Output Directory"
-        )
-        self.output_dir.frame.grid(row=current_row, column=0, sticky='ew', pady=5)
+        self.output_dir = self._add_output_dir_input(current_row)
         current_row += 1
         
         # Action button
-        btn_frame = ttk.Frame(self.content_frame, style='Tab.TFrame')
-        btn_frame.grid(row=current_row, column=0, sticky='ew', pady=10)
-        btn_frame.grid_columnconfigure(0, weight=1)
-        
-        ttk.Button(
-            btn_frame,
-            text="Embed Data",
-            command=self._start_embedding,
-            style='Action.TButton'
-        ).grid(row=0, column=1, sticky='e')
+        self._add_action_button(current_row, "Embed Data", self._start_embedding)
     
     def _validate_inputs(self) -> bool:
         """Validate all inputs before processing."""
@@ -82,68 +77,146 @@ class EmbedTab(BaseTab):
     def _start_embedding(self):
         """Start the embedding process."""
         self.files_to_process = self.data_list.get()
-        self.start_processing(self._process_embedding, self._validate_inputs)
+        self.start_processing(self._process_embedding, self._validate_inputs, self._snapshot_job)
     
-    def _process_embedding(self):
+    def _snapshot_job(self) -> dict:
+        """Capture the job's inputs from the widgets (main thread only)."""
+        return {
+            'files': list(self.files_to_process),
+            'carrier': self.carrier_input.get(),
+            'output_dir': self.output_dir.get()
+        }
+    
+    def _process_embedding(self, job: dict):
         """Process files for embedding."""
         try:
-            total_files = len(self.files_to_process)
+            files = job['files']
+            total_files = len(files)
             success = True
-            carrier = self.carrier_input.get()
+            errors = []
+            carrier = job['carrier']
             
             # Execute pre-embed hook
             self.execute_hook(
                 HookPoint.PRE_EMBED.value,
                 carrier_image=carrier,
-                files=self.files_to_process
+                files=files
             )
             
-            for i, data_file in enumerate(self.files_to_process):
-                try:
+            output_dir = job['output_dir']
+            
+            # One timestamp per run plus a per-file index, so files
+            # finished within the same second can't overwrite each other
+            run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            jobs = [
+                # Always output as PNG for data integrity
+                (data_file, os.path.join(output_dir, f"stego_{run_ts}_{i:04d}.png"))
+                for i, data_file in enumerate(files)
+            ]
+            
+            # Closing the runner on the way out cancels queued jobs,
+            # even when the loop breaks early
+            with closing(self._run_embed_jobs(carrier, jobs)) as results:
+                for i, (data_file, output_path, error) in enumerate(results):
                     file_name = os.path.basename(data_file)
-                    self.update_status(f"Embedding {file_name}")
-                    
-                    # Always output as PNG for data integrity
-                    output_path = self._generate_output_filename(
-                        data_file,
-                        self.output_dir.get(),
-                        suffix="_stego",
-                        keep_extension=False
-                    ) + ".png"
-                    
-                    # Embed the data
-                    embed_in_image(carrier, data_file, output_path)
-                    
-                    # Execute post-embed hook for this file
-                    self.execute_hook(
-                        HookPoint.POST_EMBED.value,
-                        carrier_image=carrier,
-                        data_file=data_file,
-                        output_file=output_path,
-                        success=True
-                    )
+                    if error is None:
+                        # Execute post-embed hook for this file
+                        self.execute_hook(
+                            HookPoint.POST_EMBED.value,
+                            carrier_image=carrier,
+                            data_file=data_file,
+                            output_file=output_path,
+                            success=True
+                        )
+                    else:
+                        self.execute_hook(
+                            HookPoint.POST_EMBED.value,
+                            carrier_image=carrier,
+                            data_file=data_file,
+                            error=str(error),
+                            success=False
+                        )
+                        errors.append((file_name, str(error)))
+                        success = False
                     
                     # Update progress
                     self.update_progress(i + 1, total_files)
                     
-                except Exception as e:
-                    self.execute_hook(
-                        HookPoint.POST_EMBED.value,
-                        carrier_image=carrier,
-                        data_file=data_file,
-                        error=str(e),
-                        success=False
-                    )
-                    self.show_error(f"Failed to embed {file_name}: {str(e)}")
-                    success = False
+                    if self.is_cancelled():
+                        self.update_status("Embedding cancelled")
+                        success = False
+                        break
+            
+            self.show_batch_errors(errors)
             
             if success:
                 self.show_success("Successfully embedded all data files!")
-                self.clear_fields()
+                self.call_on_main_thread(self.clear_fields)
             
         except Exception as e:
             self.show_error(str(e))
     
+    def _run_embed_jobs(self, carrier: str, jobs):
+        """Embed each (data_file, output_path) job, yielding results as they finish.
+        
+        Pixel work is CPU bound, so batches run in separate processes to
+        sidestep the GIL. The carrier is decoded once, here, and handed to
+        the workers through shared memory. Each running job still needs
+        its own working copy, so the number of workers is capped by
+        EMBED_MEMORY_BUDGET. When only one worker would fit, or there is
+        a single file, everything runs in-process.
+        """
+        try:
+            carrier_arr = load_carrier(carrier)
+        except Exception as e:
+            # Every file needs the carrier, so each one reports the failure
+            for data_file, output_path in jobs:
+                yield data_file, output_path, e
+            return
+        
+        max_workers = min(
+            len(jobs),
+            os.cpu_count() or 1,
+            EMBED_MEMORY_BUDGET // max(carrier_arr.nbytes, 1)
+        )
+        if max_workers <= 1:
+            for data_file, output_path in jobs:
+                self.update_status(f"Embedding {os.path.basename(data_file)}")
+                try:
+                    yield data_file, embed_in_image_prepared(carrier_arr, data_file, output_path), None
+                except Exception as e:
+                    yield data_file, output_path, e
+            return
+        
+        self.update_status(f"Embedding {len(jobs)} files")
+        shm = share_carrier(carrier_arr)
+        shape = carrier_arr.shape
+        carrier_arr = None  # The shared copy is the only one needed now
+        try:
+            with process_pool(
+                max_workers,
+                initializer=init_embed_worker,
+                initargs=(shm.name, shape)
+            ) as executor:
+                futures = {
+                    executor.submit(embed_worker, data_file, output_path): data_file
+                    for data_file, output_path in jobs
+                }
+                try:
+                    for future in as_completed(futures):
+                        try:
+                            yield futures[future], future.result(), None
+                        except Exception as e:
+                            yield futures[future], None, e
+                finally:
+                    # Don't start queued jobs if the caller stopped early
+                    for future in futures:
+                        future.cancel()
+        finally:
+            # The pool has shut down, so no worker is attached any more
+            shm.close()
+            shm.unlink()
+    
     def clear_fields(self):
         """Clear all input fields."""
         self.carrier_input.clear()
@@ -1,14 +1,31 @@
 import os
+import gc
+import logging
+import queue
+import threading
 import tkinter as tk
-from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from datetime import datetime
+from tkinter import ttk, messagebox
 from typing import Optional
 
 from .base_tab import BaseTab
-from ..components.file_input import FileInput, FileListInput, DirectoryInput
-from core.utils import generate_key_file, compute_file_hash, verify_file_integrity, secure_delete
-from core.aes_crypt import encrypt_file, decrypt_file
+from ..components.file_input import FileInput, FileListInput
+from core.utils import generate_key_file, secure_delete, drop_page_cache
+from core.settings_manager import settings_manager
+from core.aes_crypt import encrypt_file, encrypt_bytes, encrypt_and_hash, make_cipher_factory
 from core.plugin_system.plugin_base import HookPoint
 
+# Sequential runs read this many files ahead of the encryptor
+PREFETCH_DEPTH = 2
+# Larger files are not prefetched; they are memory-mapped when their turn comes
+PREFETCH_MAX_SIZE = 64 * 1024 * 1024
+# Files above this size only get a SHA-256 digest if the user agreed to it
+LARGE_FILE_HASH_THRESHOLD = 1 << 30
+# Most digests listed in the completion dialog; all of them are logged
+MAX_DIGESTS_SHOWN = 20
+
 class EncryptTab(BaseTab):
     """Encryption tab implementation."""
     
@@ -52,11 +69,7 @@ class EncryptTab(BaseTab):
         generate_key_check.grid(row=1, column=0, sticky='w', pady=(5, 0))
         
         # Output directory
-        self.output_dir = DirectoryInput(
-            self.content_frame,
-            "Output Directory"
-        )
-        self.output_dir.frame.grid(row=current_row, column=0, sticky='ew')
+        self.output_dir = self._add_output_dir_input(current_row, pady=0)
         current_row += 1
         
         # Security options
@@ -85,18 +98,17 @@ class EncryptTab(BaseTab):
             variable=self.secure_delete
         ).grid(row=1, column=0, sticky='w', padx=5, pady=2)
         
-        # Action button
-        btn_frame = ttk.Frame(self.content_frame, style='Tab.TFrame')
-        btn_frame.grid(row=current_row, column=0, sticky='ew', pady=10)
-        btn_frame.grid_columnconfigure(0, weight=1)  # Push button to right
-        current_row += 1
+        # Parallel processing option; when off, files are encrypted one at
+        # a time while the next ones are read ahead (see PREFETCH_DEPTH)
+        self.parallel = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            security_frame,
+            text="Encrypt several files at once (uses all CPU cores)",
+            variable=self.parallel
+        ).grid(row=2, column=0, sticky='w', padx=5, pady=2)
         
-        ttk.Button(
-            btn_frame,
-            text="Encrypt Files",
-            command=self._start_encryption,
-            style='Action.TButton'
-        ).grid(row=0, column=1, sticky='e')  # Column 1 to be on right side
+        # Action button
+        self._add_action_button(current_row, "Encrypt Files", self._start_encryption)
     
     def _validate_inputs(self) -> bool:
         """Validate all inputs before processing."""
@@ -117,111 +129,289 @@ class EncryptTab(BaseTab):
     def _start_encryption(self):
         """Start the encryption process."""
         self.files_to_process = self.file_list.get()  # Changed from get_files() to get()
-        self.start_processing(self._process_encryption, self._validate_inputs)
+        self.start_processing(self._process_encryption, self._validate_inputs, self._snapshot_job)
+    
+    def _snapshot_job(self) -> dict:
+        """Capture the job's inputs from the widgets (main thread only)."""
+        files = list(self.files_to_process)
+        compute_hash = self.compute_hash.get()
+        return {
+            'files': files,
+            'output_dir': self.output_dir.get(),
+            'key_file': self.key_input.get(),
+            'compute_hash': compute_hash,
+            'skip_hash': self._files_to_skip_hashing(files) if compute_hash else set(),
+            'secure_delete': self.secure_delete.get(),
+            'generate_key': self.generate_key.get(),
+            'parallel': self.parallel.get()
+        }
     
-    def _process_encryption(self):
+    def _files_to_skip_hashing(self, files) -> set:
+        """Return the files over LARGE_FILE_HASH_THRESHOLD that get no SHA-256 digest.
+        
+        Hashing adds a second pass of CPU work over every byte, while the
+        GCM tag already guarantees integrity. The user is asked the first
+        time a large file is encrypted; the answer is kept in settings and
+        can be changed in the Settings dialog. Must run on the main thread.
+        """
+        choice = settings_manager.get("encryption", "hash_large_files") if settings_manager else None
+        if choice:
+            return set()
+        
+        large = {f for f in files if self._file_size(f) > LARGE_FILE_HASH_THRESHOLD}
+        if not large or choice is not None:
+            return large
+        
+        choice = messagebox.askyesno(
+            "Large Files",
+            "Some files are larger than 1 GiB. Computing their SHA-256 hash "
+            "slows encryption down, and the encrypted files are already "
+            "integrity-protected.\n\n"
+            "Compute the hash for large files anyway?\n"
+            "(Your choice will be remembered; it can be changed in Settings.)"
+        )
+        if settings_manager:
+            settings_manager.set("encryption", "hash_large_files", choice)
+        return set() if choice else large
+    
+    @staticmethod
+    def _file_size(path: str) -> int:
+        """Return a file's size, or 0 if it can't be read."""
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+    
+    def _process_encryption(self, job: dict):
         """Process files for encryption."""
         try:
-            total_files = len(self.files_to_process)
+            files = job['files']
+            total_files = len(files)
             success = True
-            failed_files = []
+            encrypted_files = []
+            digests = []
+            errors = []
             
             # Execute pre-encryption hook
             self.plugin_manager.execute_hook(
                 HookPoint.PRE_ENCRYPT.value,
-                files=self.files_to_process
+                files=files
             )
             
+            output_dir = job['output_dir']
+            compute_hash = job['compute_hash']
+            do_delete = job['secure_delete']
+            gen_key = job['generate_key']
+            parallel = job['parallel']
+            
             # Generate or get key file
-            if self.generate_key.get():
-                key_file = generate_key_file(self.output_dir.get())
+            if gen_key:
+                key_file = generate_key_file(output_dir)
                 self.update_status(f"Generated key file: {key_file}")
             else:
-                key_file = self.key_input.get()
+                key_file = job['key_file']
             
-            for i, input_file in enumerate(self.files_to_process):
-                try:
+            # Derive the key once for the whole batch; each file only
+            # needs a fresh nonce
+            cipher_factory = make_cipher_factory(key_file)
+            
+            # Work out every output path up front from one run timestamp
+            # plus a per-file index, so files encrypted within the same
+            # second can't overwrite each other
+            run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            outputs = [
+                self._generate_output_filename(
+                    input_file,
+                    output_dir,
+                    suffix=".stegecrypt",
+                    keep_extension=False,
+                    timestamp=run_ts,
+                    index=i
+                )
+                for i, input_file in enumerate(files)
+            ]
+            
+            # Large files skip the optional digest unless the user opted in
+            jobs = [
+                (input_file, output_path, compute_hash and input_file not in job['skip_hash'])
+                for input_file, output_path in zip(files, outputs)
+            ]
+            # Closing the runner on the way out cancels queued files and
+            # stops the reader, even when the loop breaks early
+            with closing(self._run_encrypt_jobs(jobs, cipher_factory, parallel)) as results:
+                for completed, (input_file, output_path, file_hash, error) in enumerate(results, 1):
                     file_name = os.path.basename(input_file)
-                    
-                    # Compute original hash if verification is enabled
-                    original_hash = None
-                    if self.compute_hash.get():
-                        self.update_status(f"Computing hash for {file_name}")
-                        original_hash = compute_file_hash(input_file)
-                    
-                    # Encrypt file
-                    self.update_status(f"Encrypting {file_name}")
-                    output_path = self._generate_output_filename(
-                        input_file,
-                        self.output_dir.get(),
-                        suffix=".stegecrypt",
-                        keep_extension=False
-                    )
-                    encrypt_file(input_file, key_file, output_path)
-                    
-                    # Verify encryption if enabled
-                    if self.compute_hash.get():
-                        self.update_status(f"Verifying encryption for {file_name}")
-                        verify_filename = f"temp_verify_{os.path.basename(input_file)}"
-                        temp_decrypt = os.path.join(self.output_dir.get(), verify_filename)
+                    if error is None:
+                        encrypted_files.append(input_file)
                         
-                        try:
-                            decrypt_file(output_path, key_file, temp_decrypt)
-                            if not verify_file_integrity(temp_decrypt, original_hash):
-                                raise ValueError("Encryption verification failed")
-                        finally:
-                            if os.path.exists(temp_decrypt):
-                                os.remove(temp_decrypt)
+                        # Execute post-encryption hook for success; file_hash
+                        # is the plaintext SHA-256, or None if not computed
+                        self.plugin_manager.execute_hook(
+                            HookPoint.POST_ENCRYPT.value,
+                            input_file=input_file,
+                            output_file=output_path,
+                            file_hash=file_hash,
+                            success=True
+                        )
+                        if file_hash:
+                            logging.info(f"Encrypted {input_file} -> {output_path} (SHA-256: {file_hash})")
+                            digests.append((file_name, file_hash))
+                        self.update_status(f"Encrypted {file_name}")
+                    else:
+                        self.plugin_manager.execute_hook(
+                            HookPoint.POST_ENCRYPT.value,
+                            input_file=input_file,
+                            error=str(error),
+                            success=False
+                        )
+                        errors.append((file_name, str(error)))
+                        success = False
                     
-                    # Execute post-encryption hook for success
-                    self.plugin_manager.execute_hook(
-                        HookPoint.POST_ENCRYPT.value,
-                        input_file=input_file,
-                        output_file=output_path,
-                        success=True
-                    )
-                    
-                except Exception as e:
-                    failed_files.append((input_file, str(e)))
-                    self.plugin_manager.execute_hook(
-                        HookPoint.POST_ENCRYPT.value,
-                        input_file=input_file,
-                        error=str(e),
-                        success=False
-                    )
-                    self.show_error(f"Failed to process {file_name}: {str(e)}")
-                    success = False
-                    continue
-                    
-                finally:
                     # Update progress regardless of success/failure
-                    self.update_progress(i + 1, total_files)
+                    self.update_progress(completed, total_files)
+                    
+                    if self.is_cancelled():
+                        # Files already running finish; the rest are dropped
+                        self.update_status("Encryption cancelled")
+                        success = False
+                        break
+            
+            self.show_batch_errors(errors)
             
             # Handle secure deletion after all files are processed
-            if self.secure_delete.get():
-                for input_file in self.files_to_process:
-                    if input_file not in [f[0] for f in failed_files]:  # Only delete successfully encrypted files
-                        file_name = os.path.basename(input_file)
-                        self.update_status(f"Securely deleting {file_name}")
-                        if secure_delete(input_file):
-                            self.update_status(f"Successfully deleted {file_name}")
-                        else:
-                            self.show_warning(
-                                f"Could not securely delete {file_name}. "
-                                "The file may still be present."
-                            )
+            if do_delete:
+                # Every file was opened in a with block, so one collection
+                # here is enough to drop any lingering handles (Windows
+                # refuses to delete open files)
+                gc.collect()
+                for input_file in encrypted_files:  # Only delete successfully encrypted files
+                    file_name = os.path.basename(input_file)
+                    self.update_status(f"Securely deleting {file_name}")
+                    if secure_delete(input_file):
+                        self.update_status(f"Successfully deleted {file_name}")
+                    else:
+                        self.show_warning(
+                            f"Could not securely delete {file_name}. "
+                            "The file may still be present."
+                        )
             
             if success:
                 self.show_success(
                     f"Successfully processed {total_files} files!\n\n"
-                    f"Output directory: {self.output_dir.get()}\n"
-                    f"{'Generated key: ' + key_file if self.generate_key.get() else ''}"
+                    f"Output directory: {output_dir}\n"
+                    f"{'Generated key: ' + key_file if gen_key else ''}"
+                    f"{self._format_digests(digests)}"
                 )
-                self.clear_fields()
+                self.call_on_main_thread(self.clear_fields)
             
         except Exception as e:
             self.show_error(str(e))
     
+    @staticmethod
+    def _format_digests(digests: list) -> str:
+        """Format (file_name, digest) pairs for the completion dialog."""
+        if not digests:
+            return ""
+        lines = [f"{name}: {digest}" for name, digest in digests[:MAX_DIGESTS_SHOWN]]
+        if len(digests) > MAX_DIGESTS_SHOWN:
+            lines.append(f"...and {len(digests) - MAX_DIGESTS_SHOWN} more (see log)")
+        return "\n\nSHA-256 of the original files:\n" + "\n".join(lines)
+    
+    def _run_encrypt_jobs(self, jobs, cipher_factory, parallel: bool):
+        """Encrypt each (input_file, output_path, compute_hash) job, yielding results as they finish.
+        
+        Yields (input_file, output_path, digest, error) tuples. In parallel
+        mode files are spread over a thread pool; the cipher and file I/O
+        release the GIL while they work. Otherwise files are encrypted one
+        at a time while a reader thread loads the next ones, so disk reads
+        overlap with encryption.
+        """
+        if parallel and len(jobs) > 1:
+            self.update_status(f"Encrypting {len(jobs)} file(s)")
+            with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+                futures = {
+                    executor.submit(self._encrypt_one, input_file, output_path, cipher_factory, compute_hash): input_file
+                    for input_file, output_path, compute_hash in jobs
+                }
+                try:
+                    for future in as_completed(futures):
+                        try:
+                            yield (futures[future], *future.result(), None)
+                        except Exception as e:
+                            yield futures[future], None, None, e
+                finally:
+                    # Don't start queued jobs if the caller stopped early
+                    for future in futures:
+                        future.cancel()
+            return
+        
+        buffers = queue.Queue(maxsize=PREFETCH_DEPTH)
+        stop = threading.Event()
+        threading.Thread(
+            target=self._prefetch_files,
+            args=(jobs, buffers, stop),
+            daemon=True
+        ).start()
+        item = ()
+        try:
+            while (item := buffers.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                input_file, output_path, compute_hash, data = item
+                self.update_status(f"Encrypting {os.path.basename(input_file)}")
+                try:
+                    yield (input_file, *self._encrypt_one(input_file, output_path, cipher_factory, compute_hash, data), None)
+                except Exception as e:
+                    yield input_file, output_path, None, e
+        finally:
+            # Stop the reader, and unblock it if it is waiting on a full queue
+            stop.set()
+            while item is not None:
+                item = buffers.get()
+    
+    def _prefetch_files(self, jobs, buffers: queue.Queue, stop: threading.Event):
+        """Read job inputs into memory ahead of the encryptor (reader thread).
+        
+        Files over PREFETCH_MAX_SIZE, or that can't be read, are queued
+        without data; the encryptor then reads them itself and reports any
+        error. Any other failure is queued for the encryptor to raise, and
+        the None end marker is always queued so it never waits forever.
+        """
+        try:
+            for input_file, output_path, compute_hash in jobs:
+                if stop.is_set() or self.is_cancelled():
+                    break
+                data = None
+                try:
+                    if os.path.getsize(input_file) <= PREFETCH_MAX_SIZE:
+                        with open(input_file, 'rb') as infile:
+                            data = infile.read()
+                            drop_page_cache(infile.fileno())
+                except OSError:
+                    pass
+                buffers.put((input_file, output_path, compute_hash, data))
+        except Exception as e:
+            buffers.put(e)
+        finally:
+            buffers.put(None)
+    
+    def _encrypt_one(self, input_file: str, output_path: str, cipher_factory, compute_hash: bool, data: Optional[bytes] = None) -> tuple:
+        """Encrypt a single file, returning the output path and plaintext digest.
+        
+        If data is given it is the file's contents, already read by the
+        prefetcher. Runs on a worker thread, so it must not touch any Tk
+        widgets.
+        """
+        # Integrity is guaranteed by the GCM tag; the digest is only an
+        # out-of-band record for the user, computed in the same pass
+        if compute_hash:
+            return output_path, encrypt_and_hash(input_file, cipher_factory, output_path, data)
+        if data is not None:
+            encrypt_bytes(data, input_file, cipher_factory, output_path)
+        else:
+            encrypt_file(input_file, cipher_factory, output_path)
+        return output_path, None
+    
     def _toggle_key_input(self):
         """Toggle key input based on generate key checkbox."""
         if self.generate_key.get():
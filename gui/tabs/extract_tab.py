@@ -1,12 +1,16 @@
 import os
 import tkinter as tk
+from concurrent.futures import as_completed
+from contextlib import closing
+from datetime import datetime
 from tkinter import ttk
 from typing import Optional
 
 from .base_tab import BaseTab
-from ..components.file_input import FileListInput, DirectoryInput
-from core.steganography import extract_from_image
+from ..components.file_input import FileListInput
+from core.steganography import extract_from_image, extract_worker
 from core.plugin_system.plugin_base import HookPoint
+from core.utils import process_pool
 
 class ExtractTab(BaseTab):
     """Extract data tab implementation."""
@@ -36,24 +40,11 @@ class ExtractTab(BaseTab):
         current_row += 1
         
         # Output directory
-        self.output_dir = DirectoryInput(
-            self.content_frame,
-            "Output Directory"
-        )
-        self.output_dir.frame.grid(row=current_row, column=0, sticky='ew', pady=5)
+        self.output_dir = self._add_output_dir_input(current_row)
         current_row += 1
         
         # Action button
-        btn_frame = ttk.Frame(self.content_frame, style='Tab.TFrame')
-        btn_frame.grid(row=current_row, column=0, sticky='ew', pady=10)
-        btn_frame.grid_columnconfigure(0, weight=1)
-        
-        ttk.Button(
-            btn_frame,
-            text="Extract Data",
-            command=self._start_extraction,
-            style='Action.TButton'
-        ).grid(row=0, column=1, sticky='e')
+        self._add_action_button(current_row, "Extract Data", self._start_extraction)
     
     def _validate_inputs(self) -> bool:
         """Validate all inputs before processing."""
@@ -70,62 +61,113 @@ class ExtractTab(BaseTab):
     def _start_extraction(self):
         """Start the extraction process."""
         self.files_to_process = self.image_list.get()
-        self.start_processing(self._process_extraction, self._validate_inputs)
+        self.start_processing(self._process_extraction, self._validate_inputs, self._snapshot_job)
+    
+    def _snapshot_job(self) -> dict:
+        """Capture the job's inputs from the widgets (main thread only)."""
+        return {
+            'files': list(self.files_to_process),
+            'output_dir': self.output_dir.get()
+        }
     
-    def _process_extraction(self):
+    def _process_extraction(self, job: dict):
         """Process files for extraction."""
         try:
-            total_files = len(self.files_to_process)
+            files = job['files']
+            total_files = len(files)
             success = True
+            errors = []
             
             # Execute pre-extract hook
             self.execute_hook(
                 HookPoint.PRE_EXTRACT.value,
-                files=self.files_to_process
+                files=files
             )
             
-            for i, image_file in enumerate(self.files_to_process):
-                try:
+            output_dir = job['output_dir']
+            
+            # One timestamp per run plus a per-file index, so files
+            # finished within the same second can't overwrite each other;
+            # the extension of the hidden file is appended on extraction
+            run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            jobs = [
+                (image_file, os.path.join(output_dir, f"extracted_{run_ts}_{i:04d}"))
+                for i, image_file in enumerate(files)
+            ]
+            
+            # Closing the runner on the way out cancels queued jobs,
+            # even when the loop breaks early
+            with closing(self._run_extract_jobs(jobs)) as results:
+                for i, (image_file, output_path, error) in enumerate(results):
                     file_name = os.path.basename(image_file)
-                    self.update_status(f"Extracting from {file_name}")
-                    
-                    output_path = self._generate_output_filename(
-                        image_file,
-                        self.output_dir.get(),
-                        suffix="_extracted",
-                        keep_extension=False
-                    )
-                    
-                    extract_from_image(image_file, output_path)
-                    
-                    # Execute post-extract hook for this file
-                    self.execute_hook(
-                        HookPoint.POST_EXTRACT.value,
-                        image_file=image_file,
-                        output_file=output_path,
-                        success=True
-                    )
+                    if error is None:
+                        # Execute post-extract hook for this file
+                        self.execute_hook(
+                            HookPoint.POST_EXTRACT.value,
+                            image_file=image_file,
+                            output_file=output_path,
+                            success=True
+                        )
+                    else:
+                        self.execute_hook(
+                            HookPoint.POST_EXTRACT.value,
+                            image_file=image_file,
+                            error=str(error),
+                            success=False
+                        )
+                        errors.append((file_name, str(error)))
+                        success = False
                     
                     # Update progress
                     self.update_progress(i + 1, total_files)
                     
-                except Exception as e:
-                    self.execute_hook(
-                        HookPoint.POST_EXTRACT.value,
-                        image_file=image_file,
-                        error=str(e),
-                        success=False
-                    )
-                    self.show_error(f"Failed to extract from {file_name}: {str(e)}")
-                    success = False
+                    if self.is_cancelled():
+                        self.update_status("Extraction cancelled")
+                        success = False
+                        break
+            
+            self.show_batch_errors(errors)
             
             if success:
                 self.show_success("Successfully extracted data from all images!")
-                self.clear_fields()
+                self.call_on_main_thread(self.clear_fields)
             
         except Exception as e:
             self.show_error(str(e))
     
+    def _run_extract_jobs(self, jobs):
+        """Extract each (image_file, output_path) job, yielding results as they finish.
+        
+        Pixel work is CPU bound, so batches run in separate processes to
+        sidestep the GIL. A single image is handled in-process to avoid the
+        cost of starting a pool.
+        """
+        if len(jobs) == 1:
+            image_file, output_path = jobs[0]
+            self.update_status(f"Extracting from {os.path.basename(image_file)}")
+            try:
+                yield image_file, extract_from_image(image_file, output_path), None
+            except Exception as e:
+                yield image_file, output_path, e
+            return
+        
+        self.update_status(f"Extracting from {len(jobs)} images")
+        with process_pool(min(len(jobs), os.cpu_count() or 1)) as executor:
+            futures = {
+                executor.submit(extract_worker, image_file, output_path): image_file
+                for image_file, output_path in jobs
+            }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        yield futures[future], future.result(), None
+                    except Exception as e:
+                        yield futures[future], None, e
+            finally:
+                # Don't start queued jobs if the caller stopped early
+                for future in futures:
+                    future.cancel()
+    
     def clear_fields(self):
         """Clear all input fields."""
         self.image_list.clear()
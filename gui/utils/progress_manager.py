@@ -1,8 +1,29 @@
+import tkinter as tk
 from tkinter import ttk
 import time
+import threading
+from dataclasses import dataclass
 from typing import Optional
 from core.plugin_system.plugin_base import HookPoint
 
+# Delay before a requested UI flush in milliseconds; updates posted in
+# the meantime are folded into it (at most about 30 flushes per second)
+FLUSH_INTERVAL = 33
+# Weight of the newest per-file duration in the time-remaining average
+EMA_WEIGHT = 0.2
+
+@dataclass
+class UiState:
+    """Pending widget values; None leaves the widget unchanged."""
+    progress: Optional[float] = None
+    progress_text: Optional[str] = None
+    time_text: Optional[str] = None
+    detail: Optional[str] = None
+    status: Optional[str] = None
+    # Rewrite every given value even if it matches what was last shown,
+    # e.g. after other code has written to the widgets directly
+    refresh: bool = False
+
 class ProgressManager:
     """Manage progress updates and time estimation for file operations."""
     def __init__(self, progress_var, progress_label, status_label, time_label, progress_detail, plugin_manager=None):
@@ -13,6 +34,72 @@ class ProgressManager:
         self.progress_detail = progress_detail
         self.start_time: Optional[float] = None
         self.plugin_manager = plugin_manager
+        
+        # Moving average of seconds per file, for the time estimate
+        self._ema: Optional[float] = None
+        self._last_time: Optional[float] = None
+        self._last_completed = 0
+        
+        # Worker threads only record the latest state and ask for a flush
+        # if none is pending; the Tk main loop then applies it once,
+        # dropping intermediate frames. Nothing runs while idle.
+        self._pending_ui: Optional[UiState] = None
+        self._flush_scheduled = False
+        self._ui_lock = threading.Lock()
+        # Values last written to the widgets (main thread only)
+        self._shown = UiState()
+    
+    def _post_ui(self, **changes):
+        """Merge widget changes into the state awaiting the next flush."""
+        with self._ui_lock:
+            if self._pending_ui is None:
+                self._pending_ui = UiState()
+            for name, value in changes.items():
+                setattr(self._pending_ui, name, value)
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        
+        if schedule:
+            try:
+                self.status_label.after(FLUSH_INTERVAL, self._flush_ui)
+            except (RuntimeError, tk.TclError):
+                # No main loop to run it (e.g. shutting down); the next
+                # update will try again
+                with self._ui_lock:
+                    self._flush_scheduled = False
+    
+    def _flush_ui(self):
+        """Apply the latest pending state to the widgets (main thread only)."""
+        with self._ui_lock:
+            state, self._pending_ui = self._pending_ui, None
+            self._flush_scheduled = False
+        
+        if state is None:
+            return
+        
+        # Values already shown are skipped, since reconfiguring a widget
+        # schedules a redraw even when nothing changed. They are compared
+        # against what was last written, so the check needs no Tcl call.
+        shown = self._shown
+        if state.refresh:
+            shown = self._shown = UiState()
+        if state.progress is not None and state.progress != shown.progress:
+            self.progress_var.set(state.progress)
+            shown.progress = state.progress
+        for name, label in (
+            ('progress_text', self.progress_label),
+            ('time_text', self.time_label),
+            ('detail', self.progress_detail),
+            ('status', self.status_label)
+        ):
+            text = getattr(state, name)
+            if text is not None and text != getattr(shown, name):
+                label.config(text=text)
+                setattr(shown, name, text)
+    
+    def set_status(self, text: str):
+        """Queue a new status message."""
+        self._post_ui(status=text)
     
     def execute_hook(self, hook_point: str, **kwargs) -> list:
         """Execute hook with proper error handling."""
@@ -26,6 +113,9 @@ class ProgressManager:
     def start(self):
         """Start progress tracking."""
         self.start_time = time.time()
+        self._ema = None
+        self._last_time = self.start_time
+        self._last_completed = 0
         self.update(0, 0, "Starting...")
         
         self.execute_hook(
@@ -49,14 +139,26 @@ class ProgressManager:
                 total = results[0].get('total', total)
                 status = results[0].get('status', status)
         
+        changes = {}
         if completed > 0 and total > 0:
             progress = (completed / total) * 100
-            self.progress_var.set(progress)
-            self.progress_label.config(text=f"{progress:.1f}%")
+            changes['progress'] = progress
+            changes['progress_text'] = f"{progress:.1f}%"
             
-            # Update time remaining estimate
-            elapsed = time.time() - self.start_time if self.start_time else 0
-            avg_time = elapsed / completed
+            # Update time remaining estimate from a moving average of
+            # recent per-file durations, which follows speed changes
+            # (e.g. a run of large files) better than the overall mean
+            now = time.time()
+            elapsed = now - self.start_time if self.start_time else 0
+            if self._last_time is not None and completed > self._last_completed:
+                per_file = (now - self._last_time) / (completed - self._last_completed)
+                if self._ema is None:
+                    self._ema = per_file
+                else:
+                    self._ema = EMA_WEIGHT * per_file + (1 - EMA_WEIGHT) * self._ema
+                self._last_time = now
+                self._last_completed = completed
+            avg_time = self._ema if self._ema is not None else elapsed / completed
             remaining = (total - completed) * avg_time
             
             # Allow plugins to modify time estimation
@@ -71,12 +173,13 @@ class ProgressManager:
                 if results and isinstance(results[0], float):
                     remaining = results[0]
             
-            time_text = self._format_time_remaining(remaining)
-            self.time_label.config(text=time_text)
-            self.progress_detail.config(text=f"File {completed}/{total}")
+            changes['time_text'] = self._format_time_remaining(remaining)
+            changes['detail'] = f"File {completed}/{total}"
         
         if status:
-            self.status_label.config(text=status)
+            changes['status'] = status
+        if changes:
+            self._post_ui(**changes)
     
     def reset(self):
         """Reset all progress indicators."""
@@ -85,12 +188,20 @@ class ProgressManager:
             manager=self
         )
         
-        self.progress_var.set(0)
-        self.progress_label.config(text="0%")
-        self.status_label.config(text="Ready")
-        self.time_label.config(text="")
-        self.progress_detail.config(text="")
+        # The progress bar and status bar also reset their widgets
+        # directly, so write everything rather than trust the last values
+        self._post_ui(
+            progress=0,
+            progress_text="0%",
+            status="Ready",
+            time_text="",
+            detail="",
+            refresh=True
+        )
         self.start_time = None
+        self._ema = None
+        self._last_time = None
+        self._last_completed = 0
     
     def _format_time_remaining(self, seconds: float) -> str:
         """Format remaining time as a human-readable string."""
@@ -1,102 +1,405 @@
+import logging
 import tkinter as tk
-from tkinter import ttk
-from core.plugin_system.plugin_base import HookPoint
+import weakref
+from types import MappingProxyType
+from typing import Sequence
+
+_log = logging.getLogger(__name__)
+_EMPTY = ()  # Shared "no results" value for hook calls
+
+_DEFAULT_STYLE = MappingProxyType({
+    'justify': 'left',
+    'background': "#ffffe0",
+    'relief': 'solid',
+    'borderwidth': 1,
+    'padding': (5, 5)
+})
+
+_BINDTAG = "ToolTipTag"
+_geom = "+%d+%d".__mod__  # Formats a (x, y) tuple as a wm_geometry position
+_OFFSCREEN = "+-10000+-10000"
+
+# The hook point names are only needed once a tooltip is used, so they
+# are resolved by _lazy_init() rather than at import time
+_HP_POS = _HP_TEXT = _HP_STYLE = _HP_SHOWN = _HP_HIDE = None
+
+def _lazy_init():
+    """Resolve the tooltip hook point names on first use."""
+    global _HP_POS, _HP_TEXT, _HP_STYLE, _HP_SHOWN, _HP_HIDE
+    if _HP_POS is not None:
+        return
+    from core.plugin_system.plugin_base import HookPoint
+    _HP_POS = HookPoint.TOOLTIP_POSITION.value
+    _HP_TEXT = HookPoint.TOOLTIP_TEXT.value
+    _HP_STYLE = HookPoint.TOOLTIP_STYLE.value
+    _HP_SHOWN = HookPoint.TOOLTIP_SHOWN.value
+    _HP_HIDE = HookPoint.TOOLTIP_HIDE.value
+
+def _label_options(style):
+    """Translate ttk-style tooltip options into tk.Label options."""
+    options = dict(style)
+    if 'background' in options:
+        options['bg'] = options.pop('background')
+    if 'borderwidth' in options:
+        options['bd'] = options.pop('borderwidth')
+    if 'padding' in options:
+        padding = options.pop('padding')
+        if isinstance(padding, (tuple, list)):
+            options['padx'], options['pady'] = padding[0], padding[-1 if len(padding) < 3 else 1]
+        else:
+            options['padx'] = options['pady'] = padding
+    return options
 
 class ToolTip:
     """Create a tooltip for a given widget."""
-    def __init__(self, widget, text, plugin_manager=None):
-        self.widget = widget
+    __slots__ = (
+        '_widget_ref', 'text', 'tooltip', 'plugin_manager', 'delay',
+        '_after_id', '_hide_after', '_text_cache', '_style_cache',
+        '_position_cache', '_geom_cache', '_hooks_active', '_do_show'
+    )
+    
+    # One tooltip window is shared by every instance and reused on each hover
+    _shared_tip = None
+    _label = None
+    _owner = None  # ToolTip currently displayed in the shared window
+    # Text and style last applied to _label, to skip redundant configures
+    _last_display_text = None
+    _last_style = None
+    _use_alpha = True  # Hide by transparency instead of unmapping the window
+    # Widget path name -> ToolTip, served by one class binding on _BINDTAG
+    _registry = {}
+    # Toplevels whose <Configure> events invalidate cached tooltip positions
+    _watched_toplevels = set()
+    
+    def __init__(self, widget, text, plugin_manager=None, delay=500):
+        # Only a weak reference, so a tooltip never keeps its widget alive
+        self._widget_ref = weakref.ref(widget)
         self.text = text
         self.tooltip = None
         self.plugin_manager = plugin_manager
-        self.widget.bind('<Enter>', self.show_tooltip)
-        self.widget.bind('<Leave>', self.hide_tooltip)
+        self.delay = delay  # Milliseconds to hover before the tooltip appears
+        self._after_id = None
+        self._hide_after = None
+        # Plugin hook results, memoized per instance until invalidate()
+        self._text_cache = None
+        self._style_cache = None
+        self._position_cache = None
+        self._geom_cache = None
+        self._hooks_active = {}
+        self._refresh_listeners()
+        # Skip all hook plumbing when there are no plugins to consult
+        self._do_show = self._show_fast if plugin_manager is None else self._show_with_plugins
+        
+        if not widget.bind_class(_BINDTAG):
+            widget.bind_class(_BINDTAG, '<Enter>', ToolTip._dispatch_enter)
+            widget.bind_class(_BINDTAG, '<Leave>', ToolTip._dispatch_leave)
+            widget.bind_class(_BINDTAG, '<Destroy>', ToolTip._dispatch_destroy)
+            widget.bind_class(_BINDTAG, '<Configure>', ToolTip._dispatch_configure)
+        if _BINDTAG not in widget.bindtags():
+            widget.bindtags(widget.bindtags() + (_BINDTAG,))
+        ToolTip._registry[str(widget)] = self
+        
+        # Moving the whole window changes every widget's root coordinates;
+        # a widget's own moves and resizes are caught by _BINDTAG above
+        toplevel = widget.winfo_toplevel()
+        if str(toplevel) not in ToolTip._watched_toplevels:
+            toplevel.bind('<Configure>', ToolTip._clear_positions, add='+')
+            toplevel.bind('<Destroy>', ToolTip._forget_toplevel, add='+')
+            ToolTip._watched_toplevels.add(str(toplevel))
+    
+    @property
+    def widget(self):
+        """The widget this tooltip belongs to, or None once it is gone."""
+        return self._widget_ref()
+    
+    @staticmethod
+    def _dispatch_enter(event):
+        """Route an <Enter> event to the widget's tooltip."""
+        tip = ToolTip._registry.get(str(event.widget))
+        if tip:
+            tip.show_tooltip(event)
+    
+    @staticmethod
+    def _dispatch_leave(event):
+        """Route a <Leave> event to the widget's tooltip."""
+        tip = ToolTip._registry.get(str(event.widget))
+        if tip:
+            tip.hide_tooltip(event)
+    
+    @staticmethod
+    def _dispatch_destroy(event):
+        """Forget the tooltip of a destroyed widget."""
+        tip = ToolTip._registry.pop(str(event.widget), None)
+        if tip:
+            try:
+                tip._real_hide()
+            except tk.TclError:
+                pass  # The shared window may already be gone during teardown
     
-    def execute_hook(self, hook_point: str, **kwargs) -> list:
+    @staticmethod
+    def _dispatch_configure(event):
+        """Drop the cached position of a widget that moved or resized."""
+        tip = ToolTip._registry.get(str(event.widget))
+        if tip:
+            tip._geom_cache = None
+    
+    @staticmethod
+    def _clear_positions(event=None):
+        """Drop every cached tooltip position when a watched toplevel changes."""
+        # A toplevel's binding also receives the <Configure> events of all
+        # its descendants (e.g. a label resizing on every status update);
+        # those reach the affected tooltip through _dispatch_configure,
+        # so only the toplevel's own moves and resizes matter here
+        if event is not None and str(event.widget) not in ToolTip._watched_toplevels:
+            return
+        for tip in ToolTip._registry.values():
+            tip._geom_cache = None
+    
+    @staticmethod
+    def _forget_toplevel(event):
+        """Stop tracking a destroyed toplevel."""
+        # Descendants' <Destroy> events arrive here too; their paths are
+        # never in the set, so discarding them is a no-op
+        ToolTip._watched_toplevels.discard(str(event.widget))
+    
+    def execute_hook(self, hook_point: str, **kwargs) -> Sequence:
         """Execute hook with proper error handling."""
         if self.plugin_manager:
             try:
                 return self.plugin_manager.execute_hook(hook_point, **kwargs)
-            except Exception as e:
-                print(f"Plugin error during {hook_point}: {str(e)}")
-        return []
+            except Exception:
+                _log.exception("Plugin error during %s", hook_point)
+        return _EMPTY
     
-    def show_tooltip(self, event=None):
-        """Display the tooltip."""
-        x, y, _, _ = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 20
+    def execute_hooks_bulk(self, calls) -> list:
+        """Execute several hooks in one dispatch with proper error handling."""
+        if calls and self.plugin_manager:
+            try:
+                return self.plugin_manager.execute_hooks_bulk(calls)
+            except Exception:
+                _log.exception("Plugin error during tooltip hooks")
+        return [_EMPTY] * len(calls)
+    
+    def invalidate(self):
+        """Discard memoized hook results, e.g. after a plugin changes its config."""
+        self._clear_memo()
+        self._refresh_listeners()
+    
+    def _clear_memo(self):
+        """Drop the memoized text, style and position hook results."""
+        self._text_cache = None
+        self._style_cache = None
+        self._position_cache = None
+    
+    def _refresh_listeners(self) -> bool:
+        """Record which tooltip hook points currently have handlers.
         
-        # Allow plugins to modify tooltip position
+        Returns True if that changed since the last check.
+        """
         if self.plugin_manager:
-            results = self.execute_hook(
-                HookPoint.TOOLTIP_POSITION.value,
-                x=x,
-                y=y,
-                widget=self.widget
+            _lazy_init()
+            active = {
+                hook_point: self.plugin_manager.has_listeners(hook_point)
+                for hook_point in (_HP_POS, _HP_TEXT, _HP_STYLE, _HP_SHOWN, _HP_HIDE)
+            }
+        else:
+            active = {}
+        changed = active != self._hooks_active
+        self._hooks_active = active
+        return changed
+    
+    def show_tooltip(self, event=None):
+        """Schedule the tooltip to appear once the hover delay has elapsed."""
+        widget = self.widget
+        if widget is None:
+            return
+        if self._hide_after:
+            widget.after_cancel(self._hide_after)
+            self._hide_after = None
+            if self.tooltip:
+                return  # Already showing; the pointer only left briefly
+        
+        if self._after_id:
+            widget.after_cancel(self._after_id)
+        self._after_id = widget.after(int(self.delay), self._do_show)
+    
+    def _get_position(self):
+        """Return the tooltip anchor, cached until the window is reconfigured."""
+        if self._geom_cache is None:
+            x, y, _, _ = self.widget.bbox("insert")
+            self._geom_cache = (
+                x + self.widget.winfo_rootx() + 25,
+                y + self.widget.winfo_rooty() + 20
             )
-            if results and isinstance(results[0], dict):
-                x = results[0].get('x', x)
-                y = results[0].get('y', y)
+        return self._geom_cache
+    
+    def _show_fast(self):
+        """Display the tooltip without consulting plugins."""
+        self._after_id = None
+        if not self.text or self.widget is None:
+            return
+        x, y = self._get_position()
+        self._display(x, y, self.text, _DEFAULT_STYLE)
+    
+    def _show_with_plugins(self):
+        """Display the tooltip, letting plugins adjust it."""
+        self._after_id = None
+        if self.widget is None:
+            return
+        
+        # Plugins can be enabled or disabled at any time; checking the
+        # listeners costs a few dict lookups, and results memoized under a
+        # different set of handlers are thrown away
+        if self._refresh_listeners():
+            self._clear_memo()
+        if not any(self._hooks_active.values()):
+            self._show_fast()
+            return
+        
+        x, y = self._get_position()
+        origin = (x, y)
+        position_cached = bool(self._position_cache) and self._position_cache[0] == origin
         
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
+        # Gather the hooks whose results aren't memoized yet and dispatch
+        # them together in a single pass over the plugin manager
+        calls = []
+        if self._hooks_active.get(_HP_POS) and not position_cached:
+            calls.append((_HP_POS, {'x': x, 'y': y, 'widget': self.widget}))
+        if self._text_cache is None and self._hooks_active.get(_HP_TEXT):
+            calls.append((_HP_TEXT, {'original_text': self.text, 'widget': self.widget}))
+        style_kwargs = None
+        if self._style_cache is None:
+            style_kwargs = dict(_DEFAULT_STYLE)
+            if self._hooks_active.get(_HP_STYLE):
+                calls.append((_HP_STYLE, {'style': style_kwargs}))
+        results = dict(zip([hook_point for hook_point, _ in calls], self.execute_hooks_bulk(calls)))
+        
+        # Allow plugins to modify tooltip position
+        if _HP_POS in results:
+            position = results[_HP_POS]
+            if position and isinstance(position[0], dict):
+                x = position[0].get('x', x)
+                y = position[0].get('y', y)
+            self._position_cache = (origin, (x, y))
+        elif position_cached:
+            x, y = self._position_cache[1]
         
         # Allow plugins to modify tooltip text
-        display_text = self.text
-        if self.plugin_manager:
-            results = self.execute_hook(
-                HookPoint.TOOLTIP_TEXT.value,
-                original_text=self.text,
-                widget=self.widget
-            )
-            if results and isinstance(results[0], str):
-                display_text = results[0]
+        if self._text_cache is None:
+            text = results.get(_HP_TEXT)
+            self._text_cache = text[0] if text and isinstance(text[0], str) else self.text
         
-        # Allow plugins to modify tooltip style
-        style_kwargs = {
-            'justify': 'left',
-            'background': "#ffffe0",
-            'relief': 'solid',
-            'borderwidth': 1,
-            'padding': (5, 5)
-        }
+        # An empty text (e.g. from a plugin) suppresses the tooltip before
+        # any window work is done
+        if not self._text_cache:
+            return
         
-        if self.plugin_manager:
-            results = self.execute_hook(
-                HookPoint.TOOLTIP_STYLE.value,
-                style=style_kwargs
-            )
-            if results and isinstance(results[0], dict):
-                style_kwargs.update(results[0])
+        # Allow plugins to modify tooltip style
+        if style_kwargs is not None:
+            style = results.get(_HP_STYLE)
+            if style and isinstance(style[0], dict):
+                style_kwargs.update(style[0])
+            self._style_cache = style_kwargs
         
-        label = ttk.Label(
-            self.tooltip,
-            text=display_text,
-            **style_kwargs
-        )
-        label.pack()
+        self._display(x, y, self._text_cache, self._style_cache)
         
         # Execute post-show hook
-        self.execute_hook(
-            HookPoint.TOOLTIP_SHOWN.value,
-            tooltip=self.tooltip,
-            widget=self.widget
-        )
-    
-    def hide_tooltip(self, event=None):
-        """Hide the tooltip."""
-        if self.tooltip:
-            # Execute pre-hide hook
+        if self._hooks_active.get(_HP_SHOWN):
             self.execute_hook(
-                HookPoint.TOOLTIP_HIDE.value,
+                _HP_SHOWN,
                 tooltip=self.tooltip,
                 widget=self.widget
             )
-            self.tooltip.destroy()
+    
+    def _display(self, x, y, text, style):
+        """Show the shared tooltip window at the given position."""
+        if ToolTip._shared_tip is None or not ToolTip._shared_tip.winfo_exists():
+            _lazy_init()
+            ToolTip._shared_tip = tk.Toplevel(self.widget._root())
+            ToolTip._shared_tip.wm_overrideredirect(True)
+            # A plain tk.Label avoids the ttk theme lookups on every configure
+            ToolTip._label = tk.Label(ToolTip._shared_tip)
+            ToolTip._label.pack()
+            ToolTip._last_display_text = None
+            ToolTip._last_style = None
+            
+            # Keep the window mapped for its whole lifetime and toggle its
+            # opacity, avoiding window manager map/unmap traffic per hover
+            try:
+                ToolTip._shared_tip.wm_attributes('-alpha', 0.0)
+                ToolTip._shared_tip.wm_attributes('-topmost', True)
+                ToolTip._use_alpha = True
+            except tk.TclError:
+                ToolTip._use_alpha = False
+        
+        self.tooltip = ToolTip._shared_tip
+        ToolTip._owner = self
+        # Reconfiguring makes Tk recompute geometry and redraw, so only do it
+        # when the label content actually changes
+        if style is not ToolTip._last_style and style != ToolTip._last_style:
+            ToolTip._label.configure(**_label_options(style))
+            ToolTip._last_style = style
+        if text != ToolTip._last_display_text:
+            ToolTip._label.configure(text=text)
+            ToolTip._last_display_text = text
+        self.tooltip.wm_geometry(_geom((x, y)))
+        if ToolTip._use_alpha:
+            self.tooltip.wm_attributes('-alpha', 0.95)
+        else:
+            self.tooltip.deiconify()
+    
+    @staticmethod
+    def _conceal(tooltip):
+        """Make the shared tooltip window invisible."""
+        if ToolTip._use_alpha:
+            # Also move it away: a transparent window still takes clicks, and
+            # without a compositor -alpha has no visible effect at all
+            tooltip.wm_attributes('-alpha', 0.0)
+            tooltip.wm_geometry(_OFFSCREEN)
+        else:
+            tooltip.withdraw()
+    
+    def hide_tooltip(self, event=None):
+        """Hide the tooltip after a short grace period."""
+        widget = self.widget
+        if widget is None:
+            self._real_hide()
+            return
+        if self._after_id:
+            widget.after_cancel(self._after_id)
+            self._after_id = None
+        
+        # Debounce so quick <Leave>/<Enter> toggles don't flicker the window
+        if self.tooltip and not self._hide_after:
+            self._hide_after = widget.after(50, self._real_hide)
+    
+    def _real_hide(self):
+        """Hide the tooltip immediately, dropping any pending show or hide."""
+        # Any widget can cancel an after callback; the shared window is used
+        # when this tooltip's own widget has already been collected
+        canceller = self.widget
+        if canceller is None:
+            canceller = ToolTip._shared_tip
+        for after_id in (self._after_id, self._hide_after):
+            if after_id and canceller is not None:
+                canceller.after_cancel(after_id)
+        self._after_id = None
+        self._hide_after = None
+        
+        if self.tooltip:
+            # Execute pre-hide hook
+            if self._hooks_active.get(_HP_HIDE):
+                self.execute_hook(
+                    _HP_HIDE,
+                    tooltip=self.tooltip,
+                    widget=self.widget
+                )
+            # Another tooltip may have taken over the shared window meanwhile
+            if ToolTip._owner is self:
+                ToolTip._conceal(self.tooltip)
+                ToolTip._owner = None
             self.tooltip = None
 
-def create_tooltip(widget, text, plugin_manager=None):
+def create_tooltip(widget, text, plugin_manager=None, delay=500):
     """Helper function to create a tooltip."""
-    return ToolTip(widget, text, plugin_manager)
\ No newline at end of file
+    return ToolTip(widget, text, plugin_manager, delay)
\ No newline at end of file
@@ -1,9 +1,10 @@
 import sys
-import os
+import importlib
+import multiprocessing
+import threading
 from pathlib import Path
 import argparse
 import logging
-from datetime import datetime
 from core.plugin_system.plugin_manager import PluginManager
 from core.plugin_system.plugin_base import HookPoint
 from core.aes_crypt import init_crypto_manager
@@ -12,36 +13,6 @@ from core.utils import init_utils_manager
 from core.settings_manager import settings_manager, init_settings_manager
 from core.logging_config import configure_logging
 
-def cleanup_logs(log_dir: Path, max_logs: int = 2) -> None:
-    """
-    Clean up old log files, keeping only the specified number of most recent logs.
-    
-    Args:
-        log_dir: Path object pointing to the logs directory
-        max_logs: Maximum number of log files to keep (default: 3)
-    """
-    try:
-        # Get all log files and their creation times
-        log_files = []
-        for log_file in log_dir.glob("stegecrypt_*.log"):
-            try:
-                creation_time = os.path.getctime(log_file)
-                log_files.append((creation_time, log_file))
-            except OSError:
-                continue
-
-        # Sort by creation time (newest first)
-        log_files.sort(reverse=True)
-
-        # Remove excess log files
-        for _, log_file in log_files[max_logs:]:
-            try:
-                log_file.unlink()
-            except OSError:
-                continue
-    except Exception as e:
-        logging.error(f"Error during log cleanup: {str(e)}")
-
 def setup_logging():
     """Configure logging based on settings."""
     configure_logging(settings_manager)
@@ -64,6 +35,27 @@ def parse_arguments():
     )
     return parser.parse_args()
 
+def preload_interface(cli: bool) -> threading.Thread:
+    """Import the selected interface module on a background thread.
+    
+    Module loading then overlaps with environment and logging setup.
+    The caller must join() the thread before anything else can import
+    the same modules: a concurrent import that trips the import lock's
+    deadlock detection gets a partially initialised module instead of
+    waiting for it.
+    """
+    module_name = 'cli_interface' if cli else 'gui.app'
+    
+    def load():
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass  # The import in main() raises and reports the error
+    
+    thread = threading.Thread(target=load, daemon=True)
+    thread.start()
+    return thread
+
 def init_managers(plugin_manager):
     """Initialize all core managers."""
     init_crypto_manager(plugin_manager)
@@ -77,9 +69,17 @@ def main():
         global settings_manager
         settings_manager = init_settings_manager()
         
+        # Parse arguments, then start loading the interface we'll need
+        args = parse_arguments()
+        preload = preload_interface(args.cli)
+        
         # Setup environment and logging
         setup_environment()
         setup_logging()
+        
+        # Plugins may import interface modules themselves, so the
+        # preload has to be finished before any plugin code runs
+        preload.join()
 
         # Initialize plugin manager
         plugin_manager = PluginManager()
@@ -91,9 +91,6 @@ def main():
         # Execute startup hooks
         plugin_manager.execute_hook(HookPoint.STARTUP.value)
         
-        # Parse arguments
-        args = parse_arguments()
-        
         try:
             if args.cli:
                 # Import and run CLI interface
@@ -118,4 +115,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Needed by the decrypt, embed and extract process pools in frozen builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file